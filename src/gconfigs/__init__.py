@@ -36,15 +36,44 @@ Nothing shows better than some snippets:
     ```
 """
 
-from importlib.metadata import version
-
-from .api import (  # noqa: F401
-    dotenvs,
-    envs,
-    ini_file,
-    local_file,
-    local_files,
-    toml_file,
+# the factories (and so the backends) and `__version__` are loaded on first
+# access, keeping `import gconfigs` cheap for short lived processes
+__all__ = [
+    "composite",
+    "dotenvs",
+    "envs",
+    "ini_file",
+    "local_file",
+    "local_files",
+    "toml_file",
+]
+
+# submodules that used to be bound by importing the factories eagerly
+_SUBMODULES = frozenset(
+    ("aio", "api", "backends", "bench", "gconfigs", "schema", "stats", "watcher")
 )
 
-__version__ = version("gconfigs")
+
+def __getattr__(name):
+    if name in __all__:
+        from . import api
+
+        value = getattr(api, name)
+    elif name in _SUBMODULES:
+        from importlib import import_module
+
+        value = import_module(f".{name}", __name__)
+    elif name == "__version__":
+        # scanning the installed distributions is slow, only do it if asked
+        from importlib.metadata import version
+
+        value = version("gconfigs")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__, "__version__"})
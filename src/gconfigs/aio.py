@@ -0,0 +1,209 @@
+"""
+asyncio support for gConfigs
+
+`AsyncGConfigs` has the same API as `GConfigs`, but awaitable. Blocking
+backend calls (e.g. reading mounted files) run in a thread executor, so they
+don't block the event loop. Backends may also be natively async by
+implementing `aget` (and optionally `aget_many`) instead of `get`.
+
+Example:
+    ```python
+    from gconfigs.aio import AsyncGConfigs
+    from gconfigs.backends import LocalFiles
+
+    secrets = AsyncGConfigs(backend=LocalFiles("/run/secrets"))
+
+    async def handler():
+        api_key = await secrets("API_KEY")
+        creds = await secrets.get_many(["DB_USER", "DB_PASSWORD"])
+        async for secret in secrets:
+            print(secret.key)
+    ```
+"""
+
+import asyncio
+import json
+from functools import partial
+
+from .gconfigs import NOTSET, GConfigs, ValueOutput, _json_default, item_type
+
+
+class AsyncGConfigs:
+    def __init__(
+        self, backend, output_fmt=None, object_type_name="KeyValue", executor=None
+    ):
+        """
+        Args:
+            backend: Backend / parser of configs. Implements `keys` and `get` (run in
+                the executor) or the awaitable `aget`. See `gconfigs.backends`.
+            output_fmt (ValueOutput): Formats the values, as in `GConfigs`.
+            object_type_name (str): Simply a nice name for our key value named tuple.
+            executor (concurrent.futures.Executor): Executor for blocking backend
+                calls. Defaults to the event loop's default executor.
+        """
+        if not (
+            (hasattr(backend, "get") or hasattr(backend, "aget"))
+            and hasattr(backend, "keys")
+        ):
+            raise AttributeError(
+                "'backend' class must have at least the methods 'get' (or 'aget') and 'keys'."
+            )
+
+        self.backend = backend() if callable(backend) else backend
+        if output_fmt is None:
+            output_fmt = ValueOutput()
+        self.output_fmt = output_fmt
+        self.object_type_name = object_type_name
+        self.executor = executor
+
+    @property
+    def _configs(self):
+        # the sync API is reused, in the executor, for backends without `aget`.
+        # Building it is cheap compared to the executor round trip.
+        return GConfigs(
+            backend=self.backend,
+            output_fmt=self.output_fmt,
+            object_type_name=self.object_type_name,
+        )
+
+    @property
+    def _is_async(self):
+        return hasattr(self.backend, "aget")
+
+    async def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+
+    async def get(
+        self,
+        key,
+        *,
+        default=NOTSET,
+        use_instead=NOTSET,
+        strip=None,
+        cast=None,
+        list_sep=None,
+        bool_values=None,
+        **backend_kwargs,
+    ):
+        """Return value for given key. See `GConfigs.get` for the arguments."""
+        options = {
+            "default": default,
+            "use_instead": use_instead,
+            "strip": strip,
+            "cast": cast,
+            "list_sep": list_sep,
+            "bool_values": bool_values,
+        }
+        if not self._is_async:
+            return await self._run(self._configs.get, key, **options, **backend_kwargs)
+
+        try:
+            value = await self.backend.aget(key, **backend_kwargs)
+        except Exception as e:
+            if use_instead is not NOTSET:
+                options["use_instead"] = NOTSET
+                return await self.get(use_instead, **options, **backend_kwargs)
+
+            if default is NOTSET:
+                raise e
+
+            value = default
+
+        return self.output_fmt.format_value(value, strip, cast, list_sep, bool_values)
+
+    async def get_many(
+        self,
+        keys,
+        *,
+        defaults=None,
+        strip=None,
+        cast=None,
+        list_sep=None,
+        bool_values=None,
+        **backend_kwargs,
+    ):
+        """Return a dict with the values of all given keys. See `GConfigs.get_many`."""
+        options = {
+            "strip": strip,
+            "cast": cast,
+            "list_sep": list_sep,
+            "bool_values": bool_values,
+        }
+        if not self._is_async:
+            return await self._run(
+                self._configs.get_many,
+                keys,
+                defaults=defaults,
+                **options,
+                **backend_kwargs,
+            )
+
+        keys = tuple(keys)
+        defaults = {} if defaults is None else defaults
+        found = {}
+        if hasattr(self.backend, "aget_many"):
+            found = await self.backend.aget_many(keys, **backend_kwargs)
+
+        async def fetch(key):
+            if key in found:
+                return self.output_fmt.format_value(
+                    found[key], strip, cast, list_sep, bool_values
+                )
+            default = defaults.get(key, NOTSET)
+            return await self.get(key, default=default, **options, **backend_kwargs)
+
+        values = await asyncio.gather(*(fetch(key) for key in keys))
+        return dict(zip(keys, values, strict=True))
+
+    async def items(self):
+        """Yield plain `(key, value)` tuples of all configs."""
+        if not self._is_async:
+            items = await self._run(lambda: list(self._configs.items()))
+            for item in items:
+                yield item
+            return
+
+        values = await self.get_many(self.backend.keys())
+        for item in values.items():
+            yield item
+
+    async def iterator(self):
+        kv = item_type(self.object_type_name)
+        async for key, value in self.items():
+            yield kv(key, value)
+
+    async def json(self):
+        """Returns json parsed data of all available data."""
+        if not self._is_async:
+            return await self._run(self._configs.json)
+
+        data = {key: value async for key, value in self.items()}
+        return json.dumps(data, default=_json_default)
+
+    async def contains(self, key):
+        """Awaitable version of `key in configs`."""
+        if not self._is_async:
+            return await self._run(self._configs.__contains__, key)
+
+        if hasattr(self.backend, "contains"):
+            return self.backend.contains(key)
+        return key in self.backend.keys()
+
+    async def count(self):
+        """Awaitable version of `len(configs)`."""
+        if not self._is_async:
+            return await self._run(self._configs.__len__)
+
+        if hasattr(self.backend, "count"):
+            return self.backend.count()
+        return sum(1 for _ in self.backend.keys())
+
+    def __call__(self, key, **kwargs):
+        return self.get(key, **kwargs)
+
+    def __aiter__(self):
+        return self.iterator()
+
+    def __repr__(self):  # pragma: no cover
+        return f"<AsyncGConfigs backend={self.backend.__class__.__name__}>"
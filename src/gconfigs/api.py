@@ -1,10 +1,13 @@
-from .backends import DotEnv, File, INIFile, LocalEnv, LocalFiles, TOMLFile
+from .backends import Composite, DotEnv, File, INIFile, LocalEnv, LocalFiles, TOMLFile
 from .gconfigs import GConfigs
 
 
-def envs():
+def envs(snapshot=False):
     """Provides access to environment variables available in the system.
 
+    Args:
+        snapshot (bool): If True, the environment is copied once and read from
+            that copy. Call `envs.backend.refresh()` to copy it again.
     Returns:
         GConfigs: An instance of GConfigs with LocalEnv backend and object_type_name 'EnvironmentVariable'.
 
@@ -16,7 +19,9 @@ def envs():
         print("HOME:", home)
         ```
     """
-    return GConfigs(backend=LocalEnv, object_type_name="EnvironmentVariable")
+    return GConfigs(
+        backend=LocalEnv(snapshot=snapshot), object_type_name="EnvironmentVariable"
+    )
 
 
 def dotenvs(filepath=".env"):
@@ -38,12 +43,30 @@ def dotenvs(filepath=".env"):
     return GConfigs(backend=DotEnv(filepath=filepath), object_type_name="DotEnvConfig")
 
 
-def local_files(path="/run/configs", pattern="*"):
+def local_files(
+    path="/run/configs",
+    pattern="*",
+    cache=None,
+    max_workers=None,
+    encoding=None,
+    binary=False,
+    mmap_threshold=None,
+    atomic=False,
+):
     """Provides access to files in a local directory, which is useful for accessing mounted files in containerized environments.
 
     Args:
         path (str): The path to the directory containing the files. Defaults to "/run/configs".
         pattern (str): The glob pattern to match files. Defaults to "*", which matches all files.
+        cache (FileCache): Optional `gconfigs.backends.FileCache` to avoid re-reading unchanged files.
+        max_workers (int): If provided, read files concurrently with a thread pool of this size
+            when fetching many configs at once (`get_many`, iteration, `json`).
+        encoding (str): Encoding of the files. Defaults to the locale encoding.
+        binary (bool): If True, values are `bytes` instead of decoded strings.
+        mmap_threshold (int): With `binary`, files of at least this many bytes are
+            memory-mapped and returned as a read-only `memoryview`, without copying.
+        atomic (bool): For Kubernetes ConfigMap/Secret volumes, read every config from the
+            generation `..data` points to and switch all of them at once when it changes.
     Returns:
         GConfigs: An instance of GConfigs with LocalFiles backend and object_type_name 'Config'.
 
@@ -56,14 +79,30 @@ def local_files(path="/run/configs", pattern="*"):
         ```
     """
     return GConfigs(
-        backend=LocalFiles(path=path, pattern=pattern),
+        backend=LocalFiles(
+            path=path,
+            pattern=pattern,
+            cache=cache,
+            max_workers=max_workers,
+            encoding=encoding,
+            binary=binary,
+            mmap_threshold=mmap_threshold,
+            atomic=atomic,
+        ),
         object_type_name="Config",
     )
 
 
-def local_file():
+def local_file(cache=None, encoding=None, binary=False, mmap_threshold=None):
     """Provides access to a single local file, which is useful for accessing mounted files in containerized environments.
 
+    Args:
+        cache (FileCache): Optional `gconfigs.backends.FileCache` to avoid re-reading unchanged files.
+        encoding (str): Encoding of the files. Defaults to the locale encoding.
+        binary (bool): If True, values are `bytes` instead of decoded strings.
+        mmap_threshold (int): With `binary`, files of at least this many bytes are
+            memory-mapped and returned as a read-only `memoryview`, without copying.
+
     Returns:
         GConfigs: An instance of GConfigs with File backend and object_type_name 'FileConfig'.
 
@@ -75,14 +114,23 @@ def local_file():
         print("PASSWORD:", password)
         ```
     """
-    return GConfigs(backend=File(), object_type_name="FileConfig")
+    return GConfigs(
+        backend=File(
+            cache=cache,
+            encoding=encoding,
+            binary=binary,
+            mmap_threshold=mmap_threshold,
+        ),
+        object_type_name="FileConfig",
+    )
 
 
-def ini_file(filepath=".ini"):
+def ini_file(filepath=".ini", raw=False):
     """Provides access to configuration values defined in an .ini file.
 
     Args:
         filepath (str): The path to the .ini file. Defaults to ".ini".
+        raw (bool): If True, values are returned without `%(name)s` interpolation.
     Returns:
         GConfigs: An instance of GConfigs with INIFile backend and object_type_name 'INIConfig'.
 
@@ -94,7 +142,9 @@ def ini_file(filepath=".ini"):
         print("app.name:", app_name)
         ```
     """
-    return GConfigs(backend=INIFile(filepath=filepath), object_type_name="INIConfig")
+    return GConfigs(
+        backend=INIFile(filepath=filepath, raw=raw), object_type_name="INIConfig"
+    )
 
 
 def toml_file(filepath=".toml"):
@@ -114,3 +164,31 @@ def toml_file(filepath=".toml"):
         ```
     """
     return GConfigs(backend=TOMLFile(filepath=filepath), object_type_name="TOMLConfig")
+
+
+def composite(backends):
+    """Provides access to multiple backends using ordered fallback precedence.
+
+    Args:
+        backends (iterable): Ordered backend instances/classes. Earlier backends
+            have higher precedence on `get` and key iteration. The keys each
+            backend has are indexed, and indexed again when a backend reloads.
+            A live `LocalEnv` doesn't tell it changed: an environment variable
+            set later loses to lower layers until `configs.backend.invalidate()`
+            is called. Use `LocalEnv(snapshot=True)` and `refresh()` instead.
+    Returns:
+        GConfigs: An instance of GConfigs with Composite backend and object_type_name 'CompositeConfig'.
+
+    Example:
+        ```python
+        import gconfigs
+        from gconfigs.backends import DotEnv, LocalEnv, TOMLFile
+
+        configs = gconfigs.composite([LocalEnv, DotEnv(".env"), TOMLFile("settings.toml")])
+        debug = configs("DEBUG", cast=bool)
+        print(configs.backend.explain("DEBUG"))
+        ```
+    """
+    return GConfigs(
+        backend=Composite(backends=backends), object_type_name="CompositeConfig"
+    )
@@ -19,25 +19,221 @@ Example:
 Notes:
     - If it's not possible to provide a `.keys` method, just declare with
     an empty tuple for example, but the `.get` method is mandatory.
+    - Optionally, backends may implement `.contains(key)` and `.count()`.
+    `GConfigs` uses them for `in` and `len()` instead of scanning `.keys()`.
+    - Optionally, backends may implement `.get_many(keys)`, returning a dict
+    with the keys it could fetch. Keys left out are retried with `.get`, so
+    `GConfigs.get_many` reports the same errors as `GConfigs.get`.
+    - Optionally, backends that reload their data may expose a `.generation`
+    attribute, changed on every reload. `gconfigs.gconfigs.ValueCache` drops
+    values cached before it changed.
+    - Optionally, backends may implement `.lookup(key)`, returning the value or
+    `gconfigs.gconfigs.NOTSET` if the config is not set. `GConfigs` prefers it,
+    so misses with a `default` don't build exceptions. Other errors (e.g. no
+    permission) should still be raised.
     - For errors on `.get` method just throw exceptions.
     (Config doesn't exists, you don't have permission, stuff like that)
     See `GConfigs.get` and you'll see that it has a `default` parameter,
     and of course if you provide a default value it will not throw a exception.
 """
 
-import configparser
+import io
 import os
-import tomllib
-from fnmatch import fnmatch
-from pathlib import Path
+import re
+import stat
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from itertools import chain
+
+from .gconfigs import NOTSET
+
+# `configparser`, `tomllib`, `concurrent.futures`, `pathlib`, `fnmatch` and `mmap`
+# are imported where they are used, so `import gconfigs` (or a service that
+# only reads `envs()`) doesn't pay for backends that are never used.
+
+
+def _is_file_name(key):
+    # same as `Path(key).name == key`, without building a path
+    return os.path.basename(key) == key and key != "."
+
+
+def _check_read_options(encoding, binary, mmap_threshold):
+    if binary and encoding is not None:
+        raise ValueError("'encoding' can't be used together with 'binary'.")
+    if mmap_threshold is not None and not binary:
+        raise ValueError("'mmap_threshold' requires 'binary'.")
+
+
+def _read_path(path, encoding=None, binary=False, mmap_threshold=None):
+    """Read a file as text or, with `binary`, as bytes.
+
+    Binary files of at least `mmap_threshold` bytes are memory-mapped and
+    returned as a read-only `memoryview`, so they are neither copied nor decoded.
+    """
+    if not binary:
+        from pathlib import Path
+
+        return Path(path).read_text(encoding=encoding)
+
+    with open(path, "rb") as file:
+        if mmap_threshold is not None:
+            size = os.fstat(file.fileno()).st_size
+            # empty files can't be mapped
+            if size and size >= mmap_threshold:
+                import mmap
+
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                return memoryview(mapped)
+        return file.read()
+
+
+class FileCache:
+    """Cache of decoded file contents, used by `LocalFiles` and `File`.
+
+    Entries are keyed by path and revalidated with a single `os.stat`,
+    comparing (mtime_ns, size, inode). Unchanged files are not read again.
+
+    Args:
+        maxsize (int): Maximum number of cached files. The least recently
+            used entry is evicted first. `None` means unbounded.
+        ttl (float): If provided, an entry is trusted for `ttl` seconds after
+            it was last validated, without any syscall at all.
+    """
+
+    def __init__(self, maxsize=128, ttl=None):
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("'maxsize' must be a positive integer or None.")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def read(
+        self, path, encoding=None, binary=False, mmap_threshold=None, validate=None
+    ):
+        """Return the contents of `path`, reading the file only if it changed.
+
+        The read options are the same as `LocalFiles`. An entry read with other
+        options is read again, so a cache can be shared by text and binary
+        backends.
+
+        `validate`, if provided, is called with `path` before the file is
+        (re)read, e.g. to check where it resolves to. An unchanged entry is the
+        same file, so it's validated again only if it was cached with another
+        `validate` (e.g. by a backend sharing the cache with other paths).
+
+        Raises the same `OSError` subclasses as `os.stat` and `open`.
+        """
+        key = os.fspath(path)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if (
+                    self.ttl is not None
+                    and now - entry[2] < self.ttl
+                    and entry[0][3:] == (encoding, binary, mmap_threshold)
+                ):
+                    if validate is not None and entry[3] != validate:
+                        validate(key)
+                    return entry[1]
+
+        file_stat = os.stat(key)
+        signature = (
+            file_stat.st_mtime_ns,
+            file_stat.st_size,
+            file_stat.st_ino,
+            encoding,
+            binary,
+            mmap_threshold,
+        )
+        if entry is not None and entry[0] == signature:
+            value = entry[1]
+            if validate is None:
+                # keep the check it was validated with, for the next caller
+                validate = entry[3]
+            elif entry[3] != validate:
+                validate(key)
+        else:
+            if validate is not None:
+                validate(key)
+            if not stat.S_ISREG(file_stat.st_mode):
+                raise FileNotFoundError(f"The path {key} is not a regular file.")
+            value = _read_path(key, encoding, binary, mmap_threshold)
+
+        with self._lock:
+            self._entries[key] = (signature, value, now, validate)
+            self._entries.move_to_end(key)
+            if self.maxsize is not None and len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return value
+
+    def invalidate(self, path):
+        """Drop the cached entry for `path`, if any."""
+        with self._lock:
+            self._entries.pop(os.fspath(path), None)
+
+    def clear(self):
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, path):
+        return os.fspath(path) in self._entries
+
+    def __len__(self):
+        return len(self._entries)
 
 
 class LocalEnv:
+    def __init__(self, snapshot=False):
+        """
+        Args:
+            snapshot (bool): Copy `os.environ` into a plain dict once, instead
+                of reading the live environment on every call. Lookups are plain
+                dict hits and iteration is stable even if the environment is
+                changed meanwhile. Use `refresh` to take a new copy.
+        """
+        self.snapshot = snapshot
+        self._environ = os.environ.copy() if snapshot else os.environ
+        self.generation = 0
+
+    def refresh(self):
+        """Copy the current `os.environ` again. Nothing to do if not a snapshot."""
+        if self.snapshot:
+            self._environ = os.environ.copy()
+            self.generation += 1
+
     def keys(self):
-        return os.environ.keys()
+        return self._environ.keys()
+
+    def contains(self, key):
+        return key in self._environ
+
+    def count(self):
+        return len(self._environ)
+
+    def get_many(self, keys, **kwargs):
+        # `GConfigs` asks for a batch at a time, copying the whole live
+        # environment for each batch would cost more than reading the keys
+        environ = self._environ
+        values = {}
+        for key in keys:
+            value = environ.get(key)
+            if value is not None:
+                values[key] = value
+        return values
+
+    def lookup(self, key, **kwargs):
+        return self._environ.get(key, NOTSET)
 
     def get(self, key, **kwargs):
-        value = os.environ.get(key)
+        value = self._environ.get(key)
         if value is None:
             raise KeyError(
                 f"Environment variable '{key}' not set. Check for any "
@@ -47,10 +243,96 @@ class LocalEnv:
         return value
 
 
+# Kubernetes ConfigMap and Secret volumes keep each version of the files in a
+# timestamped directory and switch between them by swapping this symlink
+KUBERNETES_DATA_LINK = "..data"
+
+
+class _VolumeGeneration:
+    """A generation directory of a Kubernetes volume and the values read from it."""
+
+    def __init__(self, path, target, match):
+        self.path = path
+        self.target = target
+        self.generation = None
+        with os.scandir(path) as entries:
+            # only the regular files of the generation, no symlink can lead out of it
+            files = [
+                entry.name for entry in entries if entry.is_file(follow_symlinks=False)
+            ]
+        self.files = frozenset(files)
+        self.names = dict.fromkeys(name for name in files if match(name))
+        self.values = {}
+
+
 class LocalFiles:
-    def __init__(self, path="/", pattern="*"):
+    def __init__(
+        self,
+        path="/",
+        pattern="*",
+        cache=None,
+        max_workers=None,
+        executor=None,
+        encoding=None,
+        binary=False,
+        mmap_threshold=None,
+        atomic=False,
+    ):
+        """
+        Args:
+            path (str): Directory containing one file per config.
+            pattern (str): fnmatch pattern for the files considered as configs.
+            cache (FileCache): Optional cache for file contents.
+            max_workers (int): If provided, `get_many` (and so iterating all
+                configs) reads files concurrently with a thread pool of this size.
+                Useful on network-backed or FUSE-mounted volumes.
+            executor (concurrent.futures.Executor): Use this executor for
+                concurrent reads instead of creating a thread pool per call.
+            encoding (str): Encoding of the files. Defaults to the locale
+                encoding, like `open`.
+            binary (bool): Return the contents as `bytes`, without decoding.
+            mmap_threshold (int): With `binary`, files of at least this many
+                bytes are memory-mapped and returned as a read-only `memoryview`
+                instead of being copied into memory. The files must be replaced
+                (e.g. renamed over, as Kubernetes does), never truncated in place,
+                while a view is in use.
+            atomic (bool): For Kubernetes ConfigMap and Secret volumes. The
+                generation directory the `..data` symlink points to is resolved
+                once, and every value is read from it at most once. When the
+                symlink changes, all configs switch to the new generation at
+                once, so a reader never sees half old and half new configs, and
+                `generation` changes. Each call costs a single `readlink`.
+                Directories without `..data`, or with a `..data` that leads out
+                of `path`, are read as usual.
+        """
+        _check_read_options(encoding, binary, mmap_threshold)
+        self.atomic = atomic
+        self._lock = threading.Lock()
+        self._generation = 0
         self.pattern = pattern
         self.path = path
+        self.cache = cache
+        self.max_workers = max_workers
+        self.executor = executor
+        self.encoding = encoding
+        self.binary = binary
+        self.mmap_threshold = mmap_threshold
+
+    @property
+    def pattern(self):
+        return self._pattern
+
+    @pattern.setter
+    def pattern(self, pattern):
+        from fnmatch import translate
+
+        # same semantics as `fnmatch.fnmatch`, translated to a regex only once
+        flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+        self._match = re.compile(translate(pattern), flags).match
+        self._pattern = pattern
+        self._listing = None
+        self._volume = None
+        self._escaped_target = None
 
     @property
     def path(self):
@@ -58,6 +340,8 @@ class LocalFiles:
 
     @path.setter
     def path(self, path):
+        from pathlib import Path
+
         path = Path(path)
         if not path.exists():
             raise FileNotFoundError(f"The path {path} doesn't exist.")
@@ -65,22 +349,220 @@ class LocalFiles:
             raise NotADirectoryError(f"The path {path} is not a directory.")
 
         self._path = path
+        # resolved once, a mount point is not expected to move
+        self._base_path = path.resolve()
+        self._listing = None
+        self._volume = None
+        self._escaped_target = None
+
+    @property
+    def generation(self):
+        """Changes whenever an `atomic` backend switches to another generation
+        of the volume, `None` otherwise."""
+        volume = self._current_volume()
+        return None if volume is None else volume.generation
+
+    def _current_volume(self):
+        """The generation `..data` points to, or `None` if not `atomic` or
+        the directory is not a Kubernetes volume."""
+        if not self.atomic:
+            return None
+
+        try:
+            target = os.readlink(self._path / KUBERNETES_DATA_LINK)
+        except OSError:
+            return None
+
+        volume = self._volume
+        if volume is not None and volume.target == target:
+            return volume
+        if target == self._escaped_target:
+            return None
+
+        try:
+            # resolved once per generation, its files are read without resolving
+            path = (self._path / target).resolve(strict=True)
+            if not path.is_relative_to(self._base_path):
+                # read as a plain directory, where every key is checked
+                self._escaped_target = target
+                return None
+            volume = _VolumeGeneration(path, target, self._match)
+        except OSError:
+            # swapped again and already removed, or not a volume after all
+            return None
+
+        with self._lock:
+            current = self._volume
+            if current is not None and current.target == target:
+                return current
+
+            self._generation += 1
+            volume.generation = self._generation
+            self._volume = volume
+
+        return volume
+
+    def _list_files(self):
+        """Return the matching file names, listing the directory again only
+        when its mtime changed since the last listing.
+
+        Kubernetes updates mounted volumes by swapping the `..data` symlink,
+        which changes the directory mtime.
+        """
+        mtime = os.stat(self._path).st_mtime_ns
+        listing = self._listing
+        if listing is None or listing[0] != mtime:
+            match = self._match
+            with os.scandir(self._path) as entries:
+                # `is_file` uses the file type of the directory entry, only
+                # symlinks need a `stat`
+                names = dict.fromkeys(
+                    entry.name
+                    for entry in entries
+                    if match(entry.name) and entry.is_file()
+                )
+            listing = self._listing = (mtime, names)
+
+        return listing[1]
+
+    def _names(self):
+        volume = self._current_volume()
+        return self._list_files() if volume is None else volume.names
 
     def keys(self):
-        for item in self.path.iterdir():
-            if item.is_file() and fnmatch(item.name, self.pattern):
-                yield item.name
+        return self._names().keys()
 
-    def get(self, key, **kwargs):
-        if Path(key).name != key:
-            raise FileNotFoundError(
-                f"The key '{key}' is not valid for LocalFiles. "
-                "Only files directly inside the configured path are supported."
+    def contains(self, key):
+        return key in self._names()
+
+    def count(self):
+        return len(self._names())
+
+    def get_many(self, keys, **kwargs):
+        volume = self._current_volume()
+        if volume is not None:
+            return self._get_many_from_volume(volume, tuple(keys))
+
+        base_path = self._base_path
+        files = {}
+        for key in keys:
+            if not _is_file_name(key):
+                continue
+
+            if self.cache is not None:
+                # checked by `_read` only when the cache actually reads the file
+                files[key] = base_path / key
+                continue
+
+            file = (base_path / key).resolve()
+            if file.is_relative_to(base_path):
+                files[key] = file
+
+        return {
+            key: value
+            for key, value in zip(files, self._read_files(files.values()), strict=True)
+            if value is not NOTSET
+        }
+
+    def _get_many_from_volume(self, volume, keys):
+        while True:
+            values = volume.values
+            files = {
+                key: volume.path / key
+                for key in keys
+                if key in volume.files and key not in values
+            }
+            for key, value in zip(files, self._read_files(files.values()), strict=True):
+                if value is not NOTSET:
+                    values[key] = value
+
+            current = self._current_volume()
+            if current is None or current is volume or files.keys() <= values.keys():
+                return {key: values[key] for key in keys if key in values}
+
+            # swapped in the middle of the reads and the old files are gone,
+            # read everything from the new generation
+            volume = current
+
+    def _read_files(self, files):
+        """Contents of `files`, in order, `NOTSET` for the unreadable ones."""
+        if self.executor is not None:
+            return self.executor.map(self._read_file, files)
+
+        if self.max_workers is not None and len(files) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                return tuple(executor.map(self._read_file, files))
+
+        # `map` keeps the order of `files`, whatever order the reads finish in
+        return map(self._read_file, files)
+
+    def _read(self, file):
+        if self.cache is not None:
+            return self.cache.read(
+                file,
+                self.encoding,
+                self.binary,
+                self.mmap_threshold,
+                validate=self._check_inside,
             )
+        return _read_path(file, self.encoding, self.binary, self.mmap_threshold)
 
-        base_path = self.path.resolve()
-        file = (base_path / key).resolve()
+    def _check_inside(self, file):
+        from pathlib import Path
+
+        if not Path(file).resolve().is_relative_to(self._base_path):
+            raise PermissionError(
+                f"The key '{Path(file).name}' resolves outside the allowed path "
+                f"{self.path}."
+            )
 
+    def _read_file(self, file):
+        try:
+            return self._read(file)
+        except OSError:
+            # `GConfigs.get_many` falls back to `.get` for the proper error
+            return NOTSET
+
+    def _lookup_in_volume(self, volume, key):
+        while key in volume.files:
+            value = volume.values.get(key, NOTSET)
+            if value is not NOTSET:
+                return value
+
+            try:
+                value = self._read(volume.path / key)
+            except FileNotFoundError:
+                current = self._current_volume()
+                if current is None or current is volume:
+                    return NOTSET
+                volume = current
+                continue
+
+            volume.values[key] = value
+            return value
+
+        return NOTSET
+
+    def lookup(self, key, **kwargs):
+        volume = self._current_volume()
+        if volume is not None:
+            return self._lookup_in_volume(volume, key)
+
+        if not _is_file_name(key):
+            return NOTSET
+
+        base_path = self._base_path
+        if self.cache is not None:
+            # a hit costs a single `os.stat` (none within the `ttl`), symlinks
+            # are only resolved when the file is read
+            try:
+                return self._read(base_path / key)
+            except (FileNotFoundError, NotADirectoryError):
+                return NOTSET
+
+        file = (base_path / key).resolve()
         try:
             file.relative_to(base_path)
         except ValueError as e:
@@ -89,31 +571,237 @@ class LocalFiles:
             ) from e
 
         if not file.exists() or not file.is_file():
-            raise FileNotFoundError(
-                f"Check if your files are mounted on {self.path}. "
-                "And remember to check if your system is case sensitive."
-            )
+            return NOTSET
 
         if not os.access(file, os.R_OK):
             raise PermissionError(
                 f"The file {file} is not readable. Check the file permissions."
             )
 
-        return file.read_text()
+        return self._read(file)
+
+    def get(self, key, **kwargs):
+        value = self.lookup(key)
+        if value is NOTSET:
+            if not _is_file_name(key):
+                raise FileNotFoundError(
+                    f"The key '{key}' is not valid for LocalFiles. "
+                    "Only files directly inside the configured path are supported."
+                )
+
+            raise FileNotFoundError(
+                f"Check if your files are mounted on {self.path}. "
+                "And remember to check if your system is case sensitive."
+            )
+
+        return value
+
+
+_DOTENV_ESCAPES = {
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+    "\\": "\\",
+    '"': '"',
+    "'": "'",
+    "$": "$",
+}
+_DOTENV_ESCAPE_RE = re.compile(r"\\(.)", re.DOTALL)
+
+
+def _find_closing_quote(text, quote, start=0):
+    """Index of the closing `quote` in `text`, or -1. In double quoted values
+    a backslash escapes the next character."""
+    if quote == "'":
+        return text.find(quote, start)
+
+    index = text.find(quote, start)
+    while index != -1:
+        backslashes = 0
+        while index - backslashes > start and text[index - backslashes - 1] == "\\":
+            backslashes += 1
+        if backslashes % 2 == 0:
+            return index
+        index = text.find(quote, index + 1)
+
+    return -1
+
+
+def _is_value_end(rest):
+    # only whitespace or a comment may follow a closing quote
+    rest = rest.strip()
+    return not rest or rest.startswith("#")
+
+
+def _decode_dotenv_value(raw):
+    """Turn the raw text after `=` into the value.
+
+    Quoted values lose their quotes (and may span lines), double quoted
+    values have their escapes processed. Anything else is kept as is, except
+    for the trailing newline.
+    """
+    text = raw.lstrip()
+    quote = text[:1]
+    if quote in ("'", '"'):
+        closing = _find_closing_quote(text, quote, 1)
+        if closing != -1 and _is_value_end(text[closing + 1 :]):
+            value = text[1:closing].replace("\r\n", "\n")
+            if quote == '"' and "\\" in value:
+                value = _DOTENV_ESCAPE_RE.sub(
+                    lambda match: _DOTENV_ESCAPES.get(match[1], match[0]), value
+                )
+            return value
+
+    return raw.rstrip("\r\n")
+
+
+def _binary_lines(file):
+    """Lines of a binary file, with their endings, split on LF, CR and CRLF
+    like the lines of a text file opened with `newline=""`."""
+    for line in file:
+        if b"\r" in line:
+            yield from line.splitlines(keepends=True)
+        else:
+            yield line
+
+
+def _iter_dotenv(file, encoding="utf-8", offsets=False):
+    """Tokenize a dotenv file opened in binary mode, one line at a time.
+
+    Yields:
+        tuple: (key, raw value text, whether the value is quoted, start
+        offset, end offset). The byte offsets of the raw value in the file
+        are only tracked with `offsets=True`, otherwise they're None and the
+        lines are decoded as they're read, instead of one by one.
+    """
+    if offsets:
+        prefixes, separator = (b"#", b";", b"["), b"="
+    else:
+        # `newline=""` keeps the line endings, like the binary lines
+        file = io.TextIOWrapper(file, encoding=encoding, newline="")
+        prefixes, separator = ("#", ";", "["), "="
+    lines = _binary_lines(file) if offsets else iter(file)
+    offset = 0
+    start = end = None
+
+    while True:
+        for raw_line in lines:
+            if offsets:
+                offset += len(raw_line)
+            line = raw_line.lstrip()
+
+            # ignore comments, section title or invalid lines
+            if line.startswith(prefixes) or separator not in line:
+                continue
+
+            # split on the first =, allows for subsequent `=` in strings
+            key, raw = line.split(separator, 1)
+            if offsets:
+                start = offset - len(raw)
+                end = offset
+                key = key.decode(encoding)
+                raw = raw.decode(encoding)
+            key = key.strip()
+            if key.startswith("export "):
+                key = key[7:].lstrip()
+
+            if not key:
+                continue
+
+            text = raw.lstrip()
+            if not text.startswith(('"', "'")):
+                yield key, raw, False, start, end
+                continue
+
+            quote = text[0]
+
+            if _find_closing_quote(text, quote, 1) != -1:
+                yield key, raw, True, start, end
+                continue
+
+            # multi-line value, read until the closing quote
+            chunks = [raw]
+            consumed = []
+            for raw_line in lines:
+                consumed.append(raw_line)
+                chunk = raw_line.decode(encoding) if offsets else raw_line
+                chunks.append(chunk)
+                closing = _find_closing_quote(chunk, quote)
+                if closing != -1:
+                    break
+            else:
+                closing = -1
+
+            if closing != -1 and _is_value_end(chunk[closing + 1 :]):
+                if offsets:
+                    offset += sum(map(len, consumed))
+                    end = offset
+                yield key, "".join(chunks), True, start, end
+            else:
+                # not a valid quoted value, parse the next lines normally
+                yield key, raw, True, start, end
+                lines = chain(consumed, lines)
+                break
+        else:
+            return
+
+
+class _LazyValue:
+    __slots__ = ("end", "signature", "start")
+
+    def __init__(self, start, end, signature):
+        self.start = start
+        self.end = end
+        # of the file the offsets were taken from
+        self.signature = signature
 
 
 class DotEnv:
-    def __init__(self, filepath=".env"):
+    def __init__(self, filepath=".env", lazy=False, encoding="utf-8"):
+        """
+        Args:
+            filepath (str): Path of the dotenv file.
+            lazy (bool): Only record where each value is in the file while
+                loading, and read/decode a value when it's first accessed.
+                Useful for big files (e.g. embedded certificates).
+            encoding (str): Encoding of the file.
+        """
         self._dotenv_file = None
         self._data = {}
+        self.lazy = lazy
+        self.encoding = encoding
+        self.generation = 0
         self.load_file(filepath)
 
     def keys(self):
         return self._data.keys()
 
+    def contains(self, key):
+        return key in self._data
+
+    def count(self):
+        return len(self._data)
+
+    def get_many(self, keys, **kwargs):
+        values = {}
+        for key in keys:
+            value = self.lookup(key)
+            if value is not NOTSET:
+                values[key] = value
+
+        return values
+
+    def lookup(self, key, **kwargs):
+        data = self._data
+        value = data.get(key, NOTSET)
+        if value.__class__ is _LazyValue:
+            value = self._read_value(key, value, data)
+
+        return value
+
     def get(self, key, **kwargs):
-        value = self._data.get(key)
-        if value is None:
+        value = self.lookup(key)
+        if value is NOTSET:
             raise KeyError(
                 f"The config '{key}' is not set on {self._dotenv_file}. Check "
                 "for any misconfiguration or misspelling of the variable name."
@@ -121,71 +809,364 @@ class DotEnv:
 
         return value
 
+    def _read_value(self, key, lazy_value, data):
+        with open(self._dotenv_file, "rb") as file:
+            if _file_signature(file) != lazy_value.signature:
+                # the file changed since it was indexed, the offsets are stale.
+                # Reload, unless it was already reloaded meanwhile
+                if data is self._data:
+                    self.load_file(self._dotenv_file)
+                return self.lookup(key)
+
+            file.seek(lazy_value.start)
+            raw = file.read(lazy_value.end - lazy_value.start).decode(self.encoding)
+
+        value = _decode_dotenv_value(raw)
+        # only into the data it was indexed in, a reload may have replaced it
+        data[key] = value
+        return value
+
+    @property
+    def filepath(self):
+        return self._dotenv_file
+
+    def fingerprints(self):
+        """Map every key to something that changes with its value, for `Watcher`.
+
+        In lazy mode it's a digest of the raw value in the file, so nothing is
+        decoded or kept in memory.
+        """
+        if not self.lazy:
+            return dict(self._data)
+
+        import hashlib
+
+        with open(self._dotenv_file, "rb") as file:
+            return {
+                key: hashlib.blake2b(raw.encode(self.encoding), digest_size=16).digest()
+                for key, raw, *_ in _iter_dotenv(file, self.encoding)
+            }
+
     def load_file(self, filepath):
+        # parse into a new dict and swap it in at the end, so concurrent
+        # readers never see a half loaded file
+        data = {}
+        with open(filepath, "rb") as file:
+            signature = _file_signature(file)
+            if self.lazy:
+                for key, _, _, start, end in _iter_dotenv(
+                    file, self.encoding, offsets=True
+                ):
+                    data[key] = _LazyValue(start, end, signature)
+            else:
+                # only quoted values need decoding
+                for key, raw, quoted, _, _ in _iter_dotenv(file, self.encoding):
+                    data[key] = (
+                        _decode_dotenv_value(raw) if quoted else raw.rstrip("\r\n")
+                    )
+
         self._dotenv_file = filepath
-        self._data = {}
-        with open(self._dotenv_file) as file:
-            for _line in file.readlines():
-                line = _line.lstrip()
+        self._data = data
+        self.generation += 1
 
-                # ignore comments, section title or invalid lines
-                if line.startswith(("#", ";", "[")) or "=" not in line:
-                    continue
 
-                # split on the first =, allows for subsequent `=` in strings
-                key, value = line.split("=", 1)
-                key = key.strip()
+def _stat_signature(file_stat):
+    return (file_stat.st_mtime_ns, file_stat.st_size, file_stat.st_ino)
 
-                if not key:
-                    continue
 
-                self._data[key] = value.rstrip("\r\n")
+def _file_signature(file):
+    return _stat_signature(os.fstat(file.fileno()))
 
 
 class INIFile:
-    def __init__(self, filepath=".ini"):
+    def __init__(self, filepath=".ini", raw=False):
+        """
+        Args:
+            filepath (str): Path of the INI file.
+            raw (bool): Return values without `%(name)s` interpolation.
+        """
         self._ini_file = None
-        self._data = configparser.ConfigParser()
+        self._data = None
+        self._keys = {}
+        self._values = {}
+        self.raw = raw
+        self.generation = 0
         self.load_file(filepath)
 
     def keys(self):
-        for section in self._data.sections():
-            for option in self._data[section]:
-                yield f"{section}.{option}"
+        return self._keys.keys()
 
-    def get(self, key, **kwargs):
-        if "." not in key:
-            raise KeyError(
-                f"INIFile keys must use 'section.option' format. Received '{key}'."
-            )
+    def contains(self, key):
+        return key in self._keys
+
+    def count(self):
+        return len(self._keys)
+
+    def get_many(self, keys, **kwargs):
+        values = self._values
+        return {key: values[key] for key in keys if key in values}
 
+    def lookup(self, key, **kwargs):
+        value = self._values.get(key, NOTSET)
+        if value is not NOTSET or "." not in key:
+            return value
+
+        # not in the index: it's missing, its interpolation failed while loading
+        # (the error is raised again below) or the option isn't lower case
         section, option = key.split(".", 1)
         if not self._data.has_section(section) or not self._data.has_option(
             section, option
         ):
+            return NOTSET
+
+        return self._data.get(section, option, raw=self.raw)
+
+    def get(self, key, **kwargs):
+        value = self.lookup(key)
+        if value is NOTSET:
+            if "." not in key:
+                raise KeyError(
+                    f"INIFile keys must use 'section.option' format. Received '{key}'."
+                )
+
             raise KeyError(
                 f"The config '{key}' is not set on {self._ini_file}. Check "
                 "for any misconfiguration or misspelling of the variable name."
             )
 
-        return self._data.get(section, option)
+        return value
+
+    @property
+    def filepath(self):
+        return self._ini_file
 
     def load_file(self, filepath):
-        self._ini_file = filepath
-        self._data = configparser.ConfigParser()
-        loaded_files = self._data.read(self._ini_file)
+        import configparser
+
+        data = configparser.ConfigParser()
+        loaded_files = data.read(filepath)
         if not loaded_files:
-            raise FileNotFoundError(f"The file {self._ini_file} doesn't exist.")
+            raise FileNotFoundError(f"The file {filepath} doesn't exist.")
+
+        keys = {}
+        values = {}
+        for section in data.sections():
+            for option in data[section]:
+                key = f"{section}.{option}"
+                keys[key] = None
+                # interpolation is resolved once, here, instead of on every read
+                try:
+                    values.setdefault(key, data.get(section, option, raw=self.raw))
+                except configparser.InterpolationError:
+                    continue
+
+        self._ini_file = filepath
+        self._data = data
+        self._keys = keys
+        self._values = values
+        self.generation += 1
+
+
+_TOML_KEY = rb"""[A-Za-z0-9_-]+|"[^"\\\n]*(?:\\.[^"\\\n]*)*"|'[^'\n]*'"""
+_TOML_KEY_RE = re.compile(_TOML_KEY)
+_TOML_HEADER_RE = re.compile(
+    rb"\s*(\[\[?)\s*((?:%s)(?:\s*\.\s*(?:%s))*)\s*\]" % (_TOML_KEY, _TOML_KEY)
+)
+# lines without brackets or multi-line strings can't change the scanner state,
+# neither can `key = value` lines with a scalar or an array of scalars
+_TOML_STATE_RE = re.compile(rb"""[\[\]{}]|\"\"\"|'''""")
+_TOML_SCALAR = rb"""(?:"[^"\\\n]*(?:\\.[^"\\\n]*)*"|'[^'\n]*'|[^\s,\[\]{}"'#=]+)"""
+_TOML_SIMPLE_LINE_RE = re.compile(
+    rb"\s*(?:%s)(?:\s*\.\s*(?:%s))*\s*=\s*(?:%s|\[\s*(?:%s\s*,\s*)*(?:%s\s*,?\s*)?\])"
+    rb"\s*(?:#[^\n]*)?\n?\Z"
+    % (_TOML_KEY, _TOML_KEY, _TOML_SCALAR, _TOML_SCALAR, _TOML_SCALAR)
+)
+_TOML_SPECIAL_RE = re.compile(rb"""["'#\[\]{}]""")
+_TOML_BASIC_STRING_RE = re.compile(rb'"[^"\\\n]*(?:\\.[^"\\\n]*)*"')
+
+
+def _find_toml_multiline_end(line, delimiter, start):
+    """Offset right after the closing `delimiter` (\"\"\" or ''') in `line`, or -1."""
+    index = line.find(delimiter, start)
+    while index != -1 and delimiter == b'"""':
+        backslashes = 0
+        while index - backslashes > start and line[index - backslashes - 1] == 92:
+            backslashes += 1
+        if backslashes % 2 == 0:
+            break
+        index = line.find(delimiter, index + 1)
+
+    if index == -1:
+        return -1
+
+    # up to two quotes right before the delimiter belong to the string
+    end = index + 3
+    while end < len(line) and end - index < 5 and line[end] == delimiter[0]:
+        end += 1
+    return end
+
+
+def _toml_key_name(raw_key):
+    import tomllib
+
+    if raw_key[:1] in (b'"', b"'"):
+        return next(iter(tomllib.loads(raw_key.decode() + " = 0")))
+    return raw_key.decode()
+
+
+def _index_toml(file):
+    """Find the byte ranges of every table of a TOML file.
+
+    It's a light scan, it only follows strings and arrays so headers are not
+    mistaken for values. The document is validated by `tomllib` later.
+
+    Returns:
+        tuple: (end offset of the root table, `[(header path, is array of
+        tables, start, end), ...]` in document order) or None if the document
+        can't be indexed.
+    """
+    sections = []
+    root_end = None
+    current = None
+    multiline = None
+    depth = 0
+    offset = 0
+    for line in file:
+        line_offset = offset
+        offset += len(line)
+        position = 0
+
+        if multiline is not None:
+            position = _find_toml_multiline_end(line, multiline, 0)
+            if position == -1:
+                continue
+            multiline = None
+        elif _TOML_STATE_RE.search(line) is None:
+            continue
+        elif depth == 0 and (header := _TOML_HEADER_RE.match(line)):
+            if current is None:
+                root_end = line_offset
+            else:
+                sections.append((*current, line_offset))
+
+            raw_path = header[2]
+            if b'"' in raw_path or b"'" in raw_path:
+                path = tuple(
+                    _toml_key_name(key[0]) for key in _TOML_KEY_RE.finditer(raw_path)
+                )
+            elif b" " in raw_path or b"\t" in raw_path:
+                path = tuple(part.strip() for part in raw_path.decode().split("."))
+            else:
+                path = tuple(raw_path.decode().split("."))
+            current = (path, header[1] == b"[[", line_offset)
+            continue
+        elif depth == 0 and _TOML_SIMPLE_LINE_RE.match(line):
+            continue
+
+        while token := _TOML_SPECIAL_RE.search(line, position):
+            char = token[0]
+            position = token.end()
+            if char == b"#":
+                break
+            if char in (b'"', b"'"):
+                delimiter = line[token.start() : token.start() + 3]
+                if delimiter in (b'"""', b"'''"):
+                    position = _find_toml_multiline_end(line, delimiter, position + 2)
+                    if position == -1:
+                        multiline = delimiter
+                        break
+                elif char == b'"':
+                    string = _TOML_BASIC_STRING_RE.match(line, token.start())
+                    if string is None:
+                        return None
+                    position = string.end()
+                else:
+                    position = line.find(b"'", position) + 1
+                    if position == 0:
+                        return None
+            elif char in (b"[", b"{"):
+                depth += 1
+            else:
+                depth -= 1
+                if depth < 0:
+                    return None
+
+    if multiline is not None or depth != 0:
+        return None
+
+    if current is None:
+        root_end = offset
+    else:
+        sections.append((*current, offset))
+
+    return root_end, sections
+
+
+def _group_toml_sections(sections, depth):
+    """Group `sections` by the name of their table at `depth`."""
+    groups = {}
+    for section in sections:
+        groups.setdefault(section[0][depth], []).append(section)
+    return groups
+
+
+class _LazyTable:
+    """A table of a lazily loaded TOML file, with the sections (see
+    `_index_toml`) of its own headers and of all its sub-tables."""
+
+    __slots__ = ("path", "sections", "signature")
+
+    def __init__(self, path, sections, signature):
+        self.path = path
+        self.sections = sections
+        # of the file the sections were indexed from
+        self.signature = signature
 
 
 class TOMLFile:
-    def __init__(self, filepath=".toml"):
+    def __init__(self, filepath=".toml", lazy=False):
+        """
+        Args:
+            filepath (str): Path of the TOML file.
+            lazy (bool): Only index where each table is in the file while
+                loading, and parse a table when it's first accessed.
+                Useful for big documents where most tables are never read.
+                Note that syntax errors inside a table are only raised then.
+        """
         self._toml_file = None
         self._data = {}
+        self._index = None
+        self._keys = {}
+        # dotted key -> value (or subtree) already resolved, reset on `load_file`
+        self._resolved = {}
+        self.lazy = lazy
+        self.generation = 0
         self.load_file(filepath)
 
     def keys(self):
-        yield from self._iter_leaf_keys(self._data)
+        return self._key_index().keys()
+
+    def contains(self, key):
+        return key in self._key_index()
+
+    def count(self):
+        return len(self._key_index())
+
+    def _key_index(self):
+        keys = self._keys
+        if keys is None:
+            # lazy mode, every table has to be loaded to know all keys
+            self._load_subtables(self._data)
+            keys = self._keys = dict.fromkeys(self._iter_leaf_keys(self._data))
+
+        return keys
+
+    def _load_subtables(self, table):
+        """Parse the lazy tables left in `table`, so it can be handed out."""
+        for key in tuple(table):
+            value = self._child(table, key)
+            if isinstance(value, dict):
+                self._load_subtables(value)
 
     def _iter_leaf_keys(self, data, prefix=""):
         for key, value in data.items():
@@ -195,38 +1176,431 @@ class TOMLFile:
             else:
                 yield current_key
 
-    def get(self, key, **kwargs):
+    def _child(self, node, key_part):
+        if not isinstance(node, dict) or key_part not in node:
+            return NOTSET
+
+        value = node[key_part]
+        if value.__class__ is _LazyTable:
+            value = self._load_table(node, key_part, value)
+        return value
+
+    def _walk(self, key_parts):
         value = self._data
-        for key_part in key.split("."):
-            if not isinstance(value, dict) or key_part not in value:
-                raise KeyError(
-                    f"The config '{key}' is not set on {self._toml_file}. Check "
-                    "for any misconfiguration or misspelling of the variable name."
+        for key_part in key_parts:
+            value = self._child(value, key_part)
+            if value is NOTSET:
+                break
+        return value
+
+    def _load_table(self, parent, name, lazy_table):
+        import tomllib
+
+        depth = len(lazy_table.path)
+        own, children = [], []
+        for section in lazy_table.sections:
+            (own if len(section[0]) == depth else children).append(section)
+        children = _group_toml_sections(children, depth)
+        # arrays of tables and their sub-tables can only be parsed together
+        whole = any(section[1] for section in own)
+
+        while True:
+            with open(self._toml_file, "rb") as file:
+                if _file_signature(file) != lazy_table.signature:
+                    # the file changed since it was indexed, the offsets are
+                    # stale. Reload, unless it was already reloaded meanwhile
+                    index = self._index
+                    if index is not None and index[0] == lazy_table.signature:
+                        self.load_file(self._toml_file)
+                    return self._walk(lazy_table.path)
+
+                chunks = []
+                for _, _, start, end in lazy_table.sections if whole else own:
+                    file.seek(start)
+                    chunks.append(file.read(end - start))
+
+            # the chunks keep their headers, so the table is at its full path
+            table = tomllib.loads(b"".join(chunks).decode())
+            for part in lazy_table.path:
+                table = table.get(part, {})
+
+            if whole or not table.keys() & children.keys():
+                break
+            # a sub-table also defined by a dotted key, parse them together
+            whole = True
+
+        if not whole:
+            table.update(
+                (
+                    child,
+                    _LazyTable(
+                        (*lazy_table.path, child), child_sections, lazy_table.signature
+                    ),
                 )
-            value = value[key_part]
+                for child, child_sections in children.items()
+            )
+        parent[name] = table
+        return table
+
+    def get_many(self, keys, **kwargs):
+        # shared prefixes (e.g. `database.` in `database.host`, `database.port`)
+        # are walked only once
+        nodes = {(): self._data}
+
+        def resolve(key_parts):
+            if key_parts not in nodes:
+                nodes[key_parts] = self._child(resolve(key_parts[:-1]), key_parts[-1])
+            return nodes[key_parts]
+
+        values = {}
+        resolved = self._resolved
+        for key in keys:
+            value = resolved.get(key, NOTSET)
+            if value is NOTSET:
+                value = resolve(tuple(key.split(".")))
+                if value is NOTSET:
+                    continue
+                if self._keys is None and isinstance(value, dict):
+                    self._load_subtables(value)
+                resolved[key] = value
+            values[key] = value
+
+        return values
+
+    def lookup(self, key, **kwargs):
+        # `load_file` replaces the dict after the data, so values resolved while
+        # reloading end up in the discarded one
+        resolved = self._resolved
+        value = resolved.get(key, NOTSET)
+        if value is not NOTSET:
+            return value
+
+        value = self._walk(key.split("."))
+        if value is NOTSET:
+            return NOTSET
+
+        if self._keys is None and isinstance(value, dict):
+            self._load_subtables(value)
 
+        # only keys that exist are memoized, so it can't grow past the document
+        resolved[key] = value
         return value
 
+    def get(self, key, **kwargs):
+        value = self.lookup(key)
+        if value is NOTSET:
+            raise KeyError(
+                f"The config '{key}' is not set on {self._toml_file}. Check "
+                "for any misconfiguration or misspelling of the variable name."
+            )
+
+        return value
+
+    @property
+    def filepath(self):
+        return self._toml_file
+
+    def fingerprints(self):
+        """Map every key to something that changes with its value, for `Watcher`.
+
+        In lazy mode the root table is parsed again, but not the other tables:
+        each one is mapped by its header path (e.g. `tenants.acme`) to a digest
+        of its raw text.
+        """
+        index = self._index
+        if index is None:
+            return self.get_many(self.keys())
+
+        import hashlib
+        import tomllib
+
+        signature, root_end, sections = index
+        digests = {}
+        with open(self._toml_file, "rb") as file:
+            if _file_signature(file) != signature:
+                if self._index is index:
+                    self.load_file(self._toml_file)
+                return self.fingerprints()
+
+            fingerprints = tomllib.loads(file.read(root_end).decode())
+            for path, _, start, end in sections:
+                name = ".".join(path)
+                if name not in digests:
+                    digests[name] = hashlib.blake2b(digest_size=16)
+                file.seek(start)
+                digests[name].update(file.read(end - start))
+
+        fingerprints.update((name, digest.digest()) for name, digest in digests.items())
+        return fingerprints
+
     def load_file(self, filepath):
+        import tomllib
+
+        with open(filepath, "rb") as file:
+            signature = _file_signature(file)
+            # the offsets are only valid for this version of the file
+            index = (signature, *_index_toml(file)) if self.lazy else None
+            file.seek(0)
+            if index is not None:
+                _, root_end, sections = index
+                tables = _group_toml_sections(sections, 0)
+                data = tomllib.loads(file.read(root_end).decode())
+                if data.keys() & tables.keys():
+                    # tables also defined in the root table (e.g. `a.b = 1`)
+                    index = None
+                    file.seek(0)
+
+            if index is None:
+                data = tomllib.load(file)
+                keys = dict.fromkeys(self._iter_leaf_keys(data))
+            else:
+                data.update(
+                    (name, _LazyTable((name,), table_sections, signature))
+                    for name, table_sections in tables.items()
+                )
+                keys = None
+
         self._toml_file = filepath
-        with open(self._toml_file, "rb") as file:
-            self._data = tomllib.load(file)
+        self._data = data
+        self._index = index
+        self._keys = keys
+        self._resolved = {}
+        self.generation += 1
 
 
 class File:
+    def __init__(self, cache=None, encoding=None, binary=False, mmap_threshold=None):
+        """
+        Args:
+            cache (FileCache): Optional cache for file contents.
+            encoding (str): Encoding of the files. Defaults to the locale encoding.
+            binary (bool): Return the contents as `bytes`, without decoding.
+            mmap_threshold (int): With `binary`, memory-map files of at least this
+                many bytes. See `LocalFiles`.
+        """
+        _check_read_options(encoding, binary, mmap_threshold)
+        self.cache = cache
+        self.encoding = encoding
+        self.binary = binary
+        self.mmap_threshold = mmap_threshold
+
     def keys(self):
         return tuple()
 
-    def get(self, key, **kwargs):
+    def lookup(self, key, **kwargs):
+        if self.cache is not None:
+            try:
+                return self.cache.read(
+                    key, self.encoding, self.binary, self.mmap_threshold
+                )
+            except (FileNotFoundError, NotADirectoryError):
+                return NOTSET
+
+        from pathlib import Path
+
         filepath = Path(key)
         if not filepath.exists():
-            raise FileNotFoundError(
-                f"The file {filepath} doesn't exist. Check if the file is mounted correctly."
-            )
+            return NOTSET
 
         if not os.access(filepath, os.R_OK):
             raise PermissionError(
                 f"The file {filepath} is not readable. Check the file permissions."
             )
 
-        return filepath.read_text()
+        return _read_path(filepath, self.encoding, self.binary, self.mmap_threshold)
+
+    def get(self, key, **kwargs):
+        value = self.lookup(key)
+        if value is NOTSET:
+            raise FileNotFoundError(
+                f"The file {key} doesn't exist. Check if the file is mounted correctly."
+            )
+
+        return value
+
+
+def _lookup(backend, key, kwargs):
+    """`backend.lookup` for any backend. Only a miss (`NOTSET`, or `KeyError` and
+    `FileNotFoundError` from `get`) is returned as `NOTSET`, other errors (e.g.
+    no permission) are raised instead of falling through to the next backend."""
+    if hasattr(backend, "lookup"):
+        return backend.lookup(key, **kwargs)
+
+    try:
+        return backend.get(key, **kwargs)
+    except (KeyError, FileNotFoundError):
+        return NOTSET
+
+
+Explanation = namedtuple("Explanation", ["key", "backend", "layer", "shadowed"])
+Explanation.__doc__ = """Where a key of a `Composite` comes from.
+
+Attributes:
+    key (str): The explained key.
+    backend: The backend the value is read from.
+    layer (int): Position of `backend` in `Composite.backends`.
+    shadowed (tuple): Backends with lower precedence that also have the key.
+"""
+
+
+class Composite:
+    def __init__(self, backends):
+        """Layers multiple backends, earlier backends have higher precedence.
+
+        Which backend owns each key is indexed once, from the backends' `keys`,
+        so `get` goes straight to the right backend. Keys that are not listed
+        by any backend (e.g. `File` paths) are looked up in order.
+
+        The index is built again when a backend reloads (i.e. its `generation`
+        changes, see `DotEnv.load_file`, `LocalEnv.refresh` or an `atomic`
+        `LocalFiles`). Backends without `generation`, like a live `LocalEnv`,
+        are a snapshot: a key added to them later loses to a lower layer that
+        already has it, until `invalidate` is called. Use
+        `LocalEnv(snapshot=True)` and `refresh` for such a layer. A key that
+        moved or disappeared meanwhile is still found, and fixed in the index.
+
+        Only misses fall through to the next backend, other errors (e.g. an
+        unreadable file) are raised.
+
+        Args:
+            backends (iterable): Ordered backend instances/classes.
+        """
+        self.backends = tuple(
+            self._ensure_backend_instance(backend) for backend in backends
+        )
+        self._index = None
+        self._generation = 0
+
+    def _ensure_backend_instance(self, backend):
+        instance = backend() if callable(backend) else backend
+        if not (hasattr(instance, "get") and hasattr(instance, "keys")):
+            raise AttributeError(
+                "Each backend must have at least the methods 'get' and 'keys'."
+            )
+
+        return instance
+
+    def _layer_generations(self):
+        return tuple(getattr(backend, "generation", None) for backend in self.backends)
+
+    def _indexed(self):
+        """The key index and the backend generations it was built from."""
+        generations = self._layer_generations()
+        indexed = self._index
+        if indexed is None or indexed[0] != generations:
+            # built again when dropped or when any backend reloaded
+            index = {}
+            for backend in self.backends:
+                for key in backend.keys():
+                    index.setdefault(key, backend)
+            indexed = self._index = (generations, index)
+
+        return indexed
+
+    def _key_index(self):
+        return self._indexed()[1]
+
+    @property
+    def generation(self):
+        # changes when the index is dropped or any backend reloads
+        return (self._generation, *self._layer_generations())
+
+    def invalidate(self):
+        """Drop the key index, it's built again on the next access."""
+        self._index = None
+        self._generation += 1
+
+    def keys(self):
+        return self._key_index().keys()
+
+    def contains(self, key):
+        return key in self._key_index()
+
+    def count(self):
+        return len(self._key_index())
+
+    def get_many(self, keys, **kwargs):
+        index = self._key_index()
+        by_backend = {}
+        for key in keys:
+            backend = index.get(key)
+            if backend is not None:
+                by_backend.setdefault(backend, []).append(key)
+
+        values = {}
+        for backend, backend_keys in by_backend.items():
+            if hasattr(backend, "get_many"):
+                values.update(backend.get_many(backend_keys, **kwargs))
+            # keys left out are retried with `get` by `GConfigs.get_many`
+
+        return values
+
+    def lookup(self, key, **kwargs):
+        generations, index = self._indexed()
+        owner = index.get(key)
+        if owner is not None:
+            value = _lookup(owner, key, kwargs)
+            if value is not NOTSET:
+                return value
+
+        for backend in self.backends:
+            if backend is owner:
+                continue
+
+            value = _lookup(backend, key, kwargs)
+            if value is not NOTSET:
+                if owner is not None:
+                    self._reindex(generations, index, key, backend)
+                return value
+
+        if owner is not None:
+            self._reindex(generations, index, key, None)
+        return NOTSET
+
+    def _reindex(self, generations, index, key, backend):
+        """The owner of `key` doesn't have it anymore, fix only that entry
+        instead of building the whole index again."""
+        # copied, so iterating `keys()` meanwhile is safe
+        index = dict(index)
+        if backend is None:
+            index.pop(key, None)
+        else:
+            index[key] = backend
+
+        self._index = (generations, index)
+        self._generation += 1
+
+    def get(self, key, **kwargs):
+        value = self.lookup(key, **kwargs)
+        if value is NOTSET:
+            raise KeyError(f"The config '{key}' is not set in any configured backend.")
+
+        return value
+
+    def explain(self, key):
+        """Tell which backend provides `key` and which ones it shadows.
+
+        Every backend is queried, it's meant for debugging, not for hot paths.
+
+        Returns:
+            Explanation: namedtuple with `key`, `backend`, `layer` and `shadowed`.
+
+        Raises:
+            KeyError: If no backend has the key.
+        """
+        found = [
+            (layer, backend)
+            for layer, backend in enumerate(self.backends)
+            if _lookup(backend, key, {}) is not NOTSET
+        ]
+
+        if not found:
+            raise KeyError(f"The config '{key}' is not set in any configured backend.")
+
+        (layer, backend), *shadowed = found
+        return Explanation(
+            key=key,
+            backend=backend,
+            layer=layer,
+            shadowed=tuple(backend for _, backend in shadowed),
+        )
@@ -0,0 +1,345 @@
+"""
+Benchmarks for gConfigs
+
+Measures `GConfigs.get` latency for every backend, `ValueOutput` cast
+throughput, iteration/`json()` over large synthetic sources and import time.
+Results are written as JSON so they can be compared between releases.
+
+Usage:
+    ```
+    python -m gconfigs.bench                      # full run, JSON to stdout
+    python -m gconfigs.bench --quick              # smaller sources, shorter timings
+    python -m gconfigs.bench -o before.json
+    python -m gconfigs.bench --compare before.json
+    python -m gconfigs.bench -k cast              # only benchmarks matching "cast"
+    ```
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import timeit
+from decimal import Decimal
+from pathlib import Path
+
+from .backends import (
+    Composite,
+    DotEnv,
+    File,
+    INIFile,
+    LocalEnv,
+    LocalFiles,
+    TOMLFile,
+)
+from .gconfigs import GConfigs, ValueCache, ValueOutput
+
+# sizes of the synthetic sources at scale=1
+ENV_VARS = 10_000
+DOTENV_LINES = 10_000
+INI_SECTIONS = 100
+INI_OPTIONS = 100
+TOML_BYTES = 5 * 1024 * 1024
+LOCAL_FILES = 1_000
+BUNDLE_BYTES = 2 * 1024 * 1024
+
+ENV_PREFIX = "GCONFIGS_BENCH_"
+
+
+def _stats(timer, number, repeat):
+    timings = [t / number * 1e9 for t in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "min_ns": min(timings),
+        "mean_ns": sum(timings) / len(timings),
+        "max_ns": max(timings),
+        "calls": number,
+        "repeat": repeat,
+    }
+
+
+def measure(func, repeat=5, min_time=0.2):
+    """Return timing stats of calling `func()`, in nanoseconds per call.
+
+    Each repetition calls `func` enough times to take about `min_time` seconds.
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time / 10 or number >= 10_000_000:
+            break
+        number *= 10
+
+    number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+    return _stats(timer, number, repeat)
+
+
+def measure_once(func, repeat=3):
+    """Timing stats for slow operations, called once per repetition."""
+    return _stats(timeit.Timer(func), 1, repeat)
+
+
+class BenchContext:
+    """Synthetic config sources, created in a temporary directory, and the
+    timing options shared by all benchmarks."""
+
+    def __init__(self, scale=1.0, repeat=5, min_time=0.2):
+        self.scale = scale
+        self.repeat = repeat
+        self.min_time = min_time
+        self._tmp = tempfile.TemporaryDirectory(prefix="gconfigs-bench-")
+        self.root = Path(self._tmp.name)
+        self._environ = None
+
+    def size(self, value):
+        return max(1, int(value * self.scale))
+
+    def measure(self, func):
+        return measure(func, repeat=self.repeat, min_time=self.min_time)
+
+    def measure_once(self, func):
+        return measure_once(func, repeat=min(self.repeat, 3))
+
+    def __enter__(self):
+        self._environ = os.environ.copy()
+        os.environ.update(
+            {f"{ENV_PREFIX}{i}": f"value-{i}" for i in range(self.size(ENV_VARS))}
+        )
+
+        self.dotenv = self.root / ".env"
+        with open(self.dotenv, "w") as file:
+            file.writelines(
+                f"KEY_{i}=value-{i}\n" for i in range(self.size(DOTENV_LINES))
+            )
+
+        self.ini = self.root / "settings.ini"
+        with open(self.ini, "w") as file:
+            for section in range(self.size(INI_SECTIONS)):
+                file.write(f"[section{section}]\n")
+                file.writelines(
+                    f"option{option} = value-{option}\n"
+                    for option in range(INI_OPTIONS)
+                )
+
+        self.toml = self.root / "settings.toml"
+        with open(self.toml, "w") as file:
+            written, table = 0, 0
+            while written < self.size(TOML_BYTES):
+                chunk = (
+                    f"[tenants.tenant{table}]\n"
+                    f'name = "tenant-{table}"\n'
+                    f"enabled = true\n"
+                    f"[tenants.tenant{table}.db.pool]\n"
+                    f"size = {table % 50}\n"
+                    f'hosts = ["a.example.com", "b.example.com", "c.example.com"]\n'
+                )
+                written += file.write(chunk)
+                table += 1
+        self.toml_tables = table
+
+        # e.g. a CA bundle or JWKS document
+        self.bundle = self.root / "bundle.pem"
+        with open(self.bundle, "w") as file:
+            line = "MIIDdzCCAl+gAwIBAgIEAgAAuTANBgkqhkiG9w0BAQUFADBaMQswCQYDVQQGEwJJ\n"
+            file.write(line * (self.size(BUNDLE_BYTES) // len(line) + 1))
+
+        self.files = self.root / "secrets"
+        self.files.mkdir()
+        for i in range(self.size(LOCAL_FILES)):
+            (self.files / f"SECRET_{i}").write_text(f"secret-{i}\n")
+
+        # same files, laid out like a Kubernetes Secret volume
+        self.volume = self.root / "volume"
+        (self.volume / "..2026_01_01").mkdir(parents=True)
+        (self.volume / "..data").symlink_to("..2026_01_01")
+        for i in range(self.size(LOCAL_FILES)):
+            name = f"SECRET_{i}"
+            (self.volume / "..data" / name).write_text(f"secret-{i}\n")
+            (self.volume / name).symlink_to(f"..data/{name}")
+
+        return self
+
+    def __exit__(self, *exc_info):
+        os.environ.clear()
+        os.environ.update(self._environ)
+        self._tmp.cleanup()
+
+
+def bench_get(ctx, results):
+    last_toml_table = ctx.toml_tables - 1
+    cases = {
+        "LocalEnv": (LocalEnv(), f"{ENV_PREFIX}0"),
+        "LocalEnv.snapshot": (LocalEnv(snapshot=True), f"{ENV_PREFIX}0"),
+        "DotEnv": (DotEnv(ctx.dotenv), "KEY_0"),
+        "INIFile": (INIFile(ctx.ini), "section0.option0"),
+        "TOMLFile": (
+            TOMLFile(ctx.toml),
+            f"tenants.tenant{last_toml_table}.db.pool.size",
+        ),
+        "LocalFiles": (LocalFiles(ctx.files), "SECRET_0"),
+        "LocalFiles.atomic": (LocalFiles(ctx.volume, atomic=True), "SECRET_0"),
+        "File": (File(), str(ctx.files / "SECRET_0")),
+        "File.bundle": (File(), str(ctx.bundle)),
+        "File.bundle_mmap": (
+            File(binary=True, mmap_threshold=64 * 1024),
+            str(ctx.bundle),
+        ),
+        "Composite": (
+            Composite([LocalEnv(), DotEnv(ctx.dotenv), LocalFiles(ctx.files)]),
+            "SECRET_0",
+        ),
+    }
+    for name, (backend, key) in cases.items():
+        configs = GConfigs(backend=backend)
+        results[f"get.{name}"] = ctx.measure(lambda c=configs, k=key: c.get(k))
+        results[f"get.{name}.miss_default"] = ctx.measure(
+            lambda c=configs: c.get("GCONFIGS_BENCH_MISSING", default=None)
+        )
+
+    configs = GConfigs(backend=LocalEnv(), cache=ValueCache())
+    results["get.LocalEnv.cached_cast"] = ctx.measure(
+        lambda: configs.get(f"{ENV_PREFIX}0", cast=str.upper)
+    )
+
+
+def bench_cast(ctx, results):
+    out_fmt = ValueOutput()
+    cases = {
+        "bool": ("yes", bool),
+        "list": ("a, b, c, d", list),
+        "list_json": ('["a", "b", "c", "d"]', list),
+        "tuple": ("a, b, c, d", tuple),
+        "set": ("a, b, c, d", set),
+        "dict": ('{"a": 1, "b": 2}', dict),
+        "int": ("42", int),
+        "float": ("4.2", float),
+        "decimal": ("4.2", Decimal),
+        "custom": ("Value", str.lower),
+        "none": ("value", None),
+    }
+    for name, (value, cast) in cases.items():
+        results[f"cast.{name}"] = ctx.measure(
+            lambda v=value, c=cast: out_fmt.format_value(v, cast=c)
+        )
+
+
+def bench_iterate(ctx, results):
+    cases = {
+        "LocalEnv": LocalEnv(),
+        "DotEnv": DotEnv(ctx.dotenv),
+        "INIFile": INIFile(ctx.ini),
+        "TOMLFile": TOMLFile(ctx.toml),
+        "LocalFiles": LocalFiles(ctx.files),
+    }
+    for name, backend in cases.items():
+        configs = GConfigs(backend=backend)
+        results[f"iterate.{name}"] = ctx.measure_once(
+            lambda c=configs: list(c.iterator())
+        )
+        results[f"json.{name}"] = ctx.measure_once(configs.json)
+
+
+def bench_load(ctx, results):
+    results["load.DotEnv"] = ctx.measure_once(lambda: DotEnv(ctx.dotenv))
+    results["load.INIFile"] = ctx.measure_once(lambda: INIFile(ctx.ini))
+    results["load.TOMLFile"] = ctx.measure_once(lambda: TOMLFile(ctx.toml))
+    results["load.TOMLFile.lazy"] = ctx.measure_once(
+        lambda: TOMLFile(ctx.toml, lazy=True)
+    )
+
+
+def bench_import(ctx, results):
+    def run(code):
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    # interpreter startup is measured separately and subtracted
+    baseline = measure_once(lambda: run("pass"), repeat=5)
+    with_import = measure_once(lambda: run("import gconfigs"), repeat=5)
+    results["import.gconfigs"] = {
+        key: value - baseline[key] if key.endswith("_ns") else value
+        for key, value in with_import.items()
+    }
+
+
+BENCHMARKS = {
+    "get": bench_get,
+    "cast": bench_cast,
+    "iterate": bench_iterate,
+    "load": bench_load,
+    "import": bench_import,
+}
+
+
+def run(scale=1.0, select=None, repeat=5, min_time=0.2):
+    """Run the benchmarks and return the report as a dict.
+
+    Args:
+        scale (float): Size factor for the synthetic sources.
+        select (str): Only run benchmark groups whose name contains this string.
+        repeat (int): Number of timed repetitions of each benchmark.
+        min_time (float): Seconds per repetition of the fast benchmarks.
+    """
+    results = {}
+    with BenchContext(scale=scale, repeat=repeat, min_time=min_time) as ctx:
+        for name, bench in BENCHMARKS.items():
+            if select and select not in name:
+                continue
+            bench(ctx, results)
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "scale": scale,
+        "results": results,
+    }
+
+
+def compare(report, baseline):
+    """Return lines comparing `report` against a `baseline` report."""
+    lines = []
+    for name, stats in report["results"].items():
+        before = baseline["results"].get(name)
+        if before is None or before["min_ns"] <= 0:
+            continue
+        ratio = stats["min_ns"] / before["min_ns"]
+        lines.append(
+            f"{name:<40} {before['min_ns']:>14.0f} ns {stats['min_ns']:>14.0f} ns"
+            f" {ratio:>7.2f}x"
+        )
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m gconfigs.bench")
+    parser.add_argument("-o", "--output", help="write the JSON report to this file")
+    parser.add_argument("-k", "--select", help="only run matching benchmark groups")
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--quick", action="store_true", help="smaller sources and shorter timings"
+    )
+    parser.add_argument("--compare", help="JSON report to compare the results with")
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        report = run(scale=0.05, select=args.select, repeat=3, min_time=0.02)
+    else:
+        report = run(scale=args.scale, select=args.select, repeat=args.repeat)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output)
+    elif not args.compare:
+        print(output)
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        print("\n".join(compare(report, baseline)))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,13 @@
+import io
 import json
+import re
+import threading
+import time
 from collections import namedtuple
+from collections.abc import Mapping
+from functools import lru_cache, partial
+from itertools import islice
+from types import MappingProxyType
 
 
 class NoValue:
@@ -9,15 +17,103 @@ class NoValue:
 
 NOTSET = NoValue()
 
+# value written by `GConfigs.dump` for redacted keys
+REDACTED = "**********"
+
+# keys fetched per `get_many` call while iterating, bounds memory on big backends
+_BATCH_SIZE = 256
+
+
+class ValueCache:
+    """Cache of formatted values, used by `GConfigs.get`.
+
+    Entries are keyed by `(key, strip, cast, list_sep, bool_values)`, so a hit
+    skips the backend and the cast altogether. If the backend has a
+    `generation` attribute (built-in backends change it whenever they reload),
+    entries from an older generation are dropped. Otherwise (e.g. `LocalEnv`
+    reading the live environment, `LocalFiles`), use `ttl` to bound staleness.
+
+    Cached values are returned as is, don't mutate cast lists or dicts. Use one
+    cache per `GConfigs` instance.
+
+    Args:
+        maxsize (int): Maximum number of cached values. The oldest entry is
+            evicted first. `None` means unbounded.
+        ttl (float): If provided, entries expire `ttl` seconds after they were cached.
+    """
+
+    def __init__(self, maxsize=1024, ttl=None):
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("'maxsize' must be a positive integer or None.")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # reads are single (atomic) dict operations, only writes take the lock
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, generation=None):
+        """Return the cached value for `key`, or `NOTSET`."""
+        try:
+            entry = self._entries.get(key)
+        except TypeError:
+            # unhashable options (e.g. `bool_values` as a list) are not cached
+            return NOTSET
+
+        if entry is None:
+            return NOTSET
+
+        if entry[0] != generation or (
+            self.ttl is not None and time.monotonic() - entry[2] >= self.ttl
+        ):
+            self._entries.pop(key, None)
+            return NOTSET
+
+        return entry[1]
+
+    def set(self, key, value, generation=None):
+        stored_at = time.monotonic() if self.ttl is not None else None
+        with self._lock:
+            try:
+                self._entries[key] = (generation, value, stored_at)
+            except TypeError:
+                return
+
+            if self.maxsize is not None and len(self._entries) > self.maxsize:
+                self._entries.pop(next(iter(self._entries)), None)
+
+    def invalidate(self, key):
+        """Drop every cached value of the config `key`, whatever the options."""
+        with self._lock:
+            for cache_key in [k for k in list(self._entries) if k[0] == key]:
+                self._entries.pop(cache_key, None)
+
+    def clear(self):
+        """Drop every cached value."""
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
 
 class GConfigs:
-    def __init__(self, backend, output_fmt=None, object_type_name="KeyValue"):
+    def __init__(
+        self,
+        backend,
+        output_fmt=None,
+        object_type_name="KeyValue",
+        cache=None,
+        observer=None,
+    ):
         """
         Args:
             backend: Backend / parser of configs. A simple class implementing `get` and `keys` methods.
                 `gconfigs.backends` for more information.
             object_type_name (str): Simply a nice name for our key value named tuple.
             output_fmt (class): An instance of
+            cache (ValueCache): Optional cache of the values returned by `get`.
+            observer: Optional instrumentation of `get` calls, e.g.
+                `gconfigs.stats.StatsCollector`. See `gconfigs.stats`.
         """
         if not (hasattr(backend, "get") and hasattr(backend, "keys")):
             raise AttributeError(
@@ -29,6 +125,8 @@ class GConfigs:
             output_fmt = ValueOutput()
         self.output_fmt = output_fmt
         self.object_type_name = object_type_name
+        self.cache = cache
+        self.observer = observer
         self._iter_configs = self.iterator()
 
     def get(
@@ -61,11 +159,53 @@ class GConfigs:
             Parsed value or default. Or raises exceptions you implement in your backend.
         """
 
+        observer = self.observer
+        cache = self.cache
+        if cache is not None and not backend_kwargs:
+            # read before fetching, a reload meanwhile makes the entry stale
+            generation = getattr(self.backend, "generation", None)
+            cache_key = (key, strip, cast, list_sep, bool_values)
+            value = cache.get(cache_key, generation)
+            if value is not NOTSET:
+                if observer is not None:
+                    observer.on_get(key, self.backend, "cached", None)
+                return value
+        else:
+            cache = None
+
+        if observer is not None:
+            started = time.perf_counter_ns()
+
+        lookup = getattr(self.backend, "lookup", None)
         try:
-            value = self.backend.get(key, **backend_kwargs)
+            if lookup is None:
+                value = self.backend.get(key, **backend_kwargs)
+            else:
+                # misses are returned as NOTSET, no exception is built for them
+                value = lookup(key, **backend_kwargs)
+                if value is NOTSET and default is NOTSET and use_instead is NOTSET:
+                    # nothing to fall back to, let the backend raise its own error
+                    value = self.backend.get(key, **backend_kwargs)
         # This may seem a generic try/except but I'm actually catching the
         # specific Exception that you will implement in your backend.
         except Exception as e:
+            if default is NOTSET and use_instead is NOTSET:
+                if observer is not None:
+                    elapsed = time.perf_counter_ns() - started
+                    observer.on_get(key, self.backend, "miss", elapsed)
+                raise e
+
+            value = NOTSET
+
+        if observer is not None:
+            if value is not NOTSET:
+                outcome = "hit"
+            else:
+                outcome = "default" if use_instead is NOTSET else "use_instead"
+            elapsed = time.perf_counter_ns() - started
+            observer.on_get(key, self.backend, outcome, elapsed)
+
+        if value is NOTSET:
             if use_instead is not NOTSET:
                 return self.get(
                     use_instead,
@@ -78,31 +218,172 @@ class GConfigs:
                     **backend_kwargs,
                 )
 
-            if default is NOTSET:
-                raise e
-
+            # defaults are not cached, the key may be set later
+            cache = None
             value = default
 
-        value = self.output_fmt.format_value(value, strip, cast, list_sep, bool_values)
+        try:
+            value = self.output_fmt.format_value(
+                value, strip, cast, list_sep, bool_values
+            )
+        except Exception as e:
+            if observer is not None:
+                observer.on_cast_error(key, cast, e)
+            raise
+
+        if cache is not None:
+            cache.set(cache_key, value, generation)
 
         return value
 
+    def get_many(
+        self,
+        keys,
+        *,
+        defaults=None,
+        strip=None,
+        cast=None,
+        list_sep=None,
+        bool_values=None,
+        **backend_kwargs,
+    ):
+        """Return a dict with the values of all given keys.
+
+        Args:
+            keys (iterable): Keys (Names) of configs.
+            defaults (dict): Default values for keys the backend doesn't return.
+                Keys missing from both the backend and `defaults` raise, like `get`.
+            strip, cast, list_sep, bool_values: Applied to every value. See `get`.
+
+        Backends implementing `get_many` fetch all keys in a single call.
+        """
+        raw = self._get_raw_many(keys, defaults, backend_kwargs)
+        return {
+            key: self.output_fmt.format_value(value, strip, cast, list_sep, bool_values)
+            for key, value in raw.items()
+        }
+
+    def _get_raw_many(self, keys, defaults=None, backend_kwargs=None):
+        keys = tuple(keys)
+        defaults = {} if defaults is None else defaults
+        backend_kwargs = {} if backend_kwargs is None else backend_kwargs
+
+        found = {}
+        if hasattr(self.backend, "get_many"):
+            found = self.backend.get_many(keys, **backend_kwargs)
+
+        lookup = getattr(self.backend, "lookup", None)
+        values = {}
+        for key in keys:
+            if key in found:
+                values[key] = found[key]
+                continue
+
+            try:
+                value = NOTSET
+                if lookup is not None and key in defaults:
+                    value = lookup(key, **backend_kwargs)
+                else:
+                    value = self.backend.get(key, **backend_kwargs)
+            except Exception:
+                if key not in defaults:
+                    raise
+
+            values[key] = defaults[key] if value is NOTSET else value
+
+        return values
+
     def json(self):
         """Returns json parsed data of all available data."""
+        output = io.StringIO()
+        self.dump(output)
+        return output.getvalue()
 
-        def set_default(obj):
-            if isinstance(obj, set):
-                return list(obj)
-            raise TypeError
+    def dump(self, fp, format="json", *, include=None, redact=None):
+        """Write all configs to the text file object `fp`, one key at a time.
 
-        return json.dumps(
-            {item.key: item.value for item in self.iterator()}, default=set_default
-        )
+        Values are fetched in small batches and written as they come, so neither
+        all values nor the whole output are held in memory.
+
+        Args:
+            fp: Text file object (anything with a `write` method).
+            format (str): "json", a single object (same output as `json()`), or
+                "jsonl", one `{"key": ..., "value": ...}` object per line.
+            include (str|iterable): fnmatch pattern(s). Only matching keys are written.
+            redact (str|iterable): fnmatch pattern(s) of keys written with the
+                `REDACTED` placeholder instead of their value. Their values are
+                never read.
+        """
+        if format not in ("json", "jsonl"):
+            raise ValueError(
+                f"Unsupported dump format '{format}'. Use 'json' or 'jsonl'."
+            )
+
+        keys = self.backend.keys()
+        if include is not None:
+            is_included = _key_matcher(include)
+            keys = (key for key in keys if is_included(key))
+
+        items = self._items(keys, None if redact is None else _key_matcher(redact))
+        if format == "jsonl":
+            for key, value in items:
+                fp.write(
+                    json.dumps({"key": key, "value": value}, default=_json_default)
+                )
+                fp.write("\n")
+            return
+
+        separator = ""
+        fp.write("{")
+        for key, value in items:
+            fp.write(
+                f"{separator}{json.dumps(key)}: "
+                f"{json.dumps(value, default=_json_default)}"
+            )
+            separator = ", "
+        fp.write("}")
+
+    def snapshot(self):
+        """Resolve every config once and return an immutable `Snapshot`.
+
+        Values are fetched from the backend and formatted with the default
+        `output_fmt` options a single time, so later lookups are plain dict hits.
+        """
+        raw = self._get_raw_many(self.backend.keys())
+        return Snapshot(raw, output_fmt=self.output_fmt)
+
+    def items(self):
+        """Yield plain `(key, value)` tuples of all configs.
+
+        Same as `iterator`, for callers that don't need the named fields.
+        """
+        return self._items(self.backend.keys())
+
+    def _items(self, keys, is_redacted=None):
+        bulk = hasattr(self.backend, "get_many")
+        keys = iter(keys)
+        while batch := tuple(islice(keys, _BATCH_SIZE)):
+            redacted = set()
+            if is_redacted is not None:
+                redacted = {key for key in batch if is_redacted(key)}
+
+            values = {}
+            if bulk:
+                # let the backend fetch a batch at once (e.g. concurrently)
+                values = self.get_many(key for key in batch if key not in redacted)
+
+            for key in batch:
+                if key in redacted:
+                    yield key, REDACTED
+                elif bulk:
+                    yield key, values[key]
+                else:
+                    yield key, self.get(key)
 
     def iterator(self):
-        kv = namedtuple(self.object_type_name, ["key", "value"])
-        for key in self.backend.keys():
-            yield kv(key=key, value=self.get(key))
+        kv = item_type(self.object_type_name)
+        for key, value in self.items():
+            yield kv(key, value)
 
     def __call__(self, key, **kwargs):
         return self.get(key, **kwargs)
@@ -115,15 +396,180 @@ class GConfigs:
         return self
 
     def __contains__(self, key):
+        # backends may provide a fast path instead of scanning all keys
+        if hasattr(self.backend, "contains"):
+            return self.backend.contains(key)
+
         return key in self.backend.keys()
 
     def __len__(self):
-        return len(self.backend.keys())
+        if hasattr(self.backend, "count"):
+            return self.backend.count()
+
+        keys = self.backend.keys()
+        try:
+            return len(keys)
+        except TypeError:
+            # `keys` may be a generator
+            return sum(1 for _ in keys)
 
     def __repr__(self):  # pragma: no cover
         return f"<GConfigs backend={self.backend.__class__.__name__}>"
 
 
+class Snapshot(Mapping):
+    """Immutable, pre-resolved view of the configs of a `GConfigs` instance.
+
+    Created with `GConfigs.snapshot()`. Supports the same `get`/call surface as
+    `GConfigs`; lookups without formatting options return the pre-formatted
+    value directly. Note that container values (lists, dicts) are returned as-is.
+    """
+
+    __slots__ = ("_data", "_hash", "_raw", "output_fmt")
+
+    def __init__(self, raw, output_fmt=None):
+        if output_fmt is None:
+            output_fmt = ValueOutput()
+
+        object.__setattr__(self, "output_fmt", output_fmt)
+        object.__setattr__(self, "_raw", dict(raw))
+        object.__setattr__(
+            self,
+            "_data",
+            {key: output_fmt.format_value(value) for key, value in raw.items()},
+        )
+        object.__setattr__(self, "_hash", None)
+
+    def get(
+        self,
+        key,
+        *,
+        default=NOTSET,
+        use_instead=NOTSET,
+        strip=None,
+        cast=None,
+        list_sep=None,
+        bool_values=None,
+    ):
+        """Return value for given key. See `GConfigs.get` for the arguments."""
+        fast_path = (
+            strip is None and cast is None and list_sep is None and bool_values is None
+        )
+        if key in self._data:
+            if fast_path:
+                return self._data[key]
+            value = self._raw[key]
+        elif use_instead is not NOTSET:
+            return self.get(
+                use_instead,
+                default=default,
+                strip=strip,
+                cast=cast,
+                list_sep=list_sep,
+                bool_values=bool_values,
+            )
+        elif default is NOTSET:
+            raise KeyError(f"The config '{key}' is not set on this snapshot.")
+        else:
+            value = default
+
+        return self.output_fmt.format_value(value, strip, cast, list_sep, bool_values)
+
+    def get_many(
+        self,
+        keys,
+        *,
+        defaults=None,
+        strip=None,
+        cast=None,
+        list_sep=None,
+        bool_values=None,
+    ):
+        """Return a dict with the values of all given keys. See `GConfigs.get_many`."""
+        defaults = {} if defaults is None else defaults
+        return {
+            key: self.get(
+                key,
+                default=defaults.get(key, NOTSET),
+                strip=strip,
+                cast=cast,
+                list_sep=list_sep,
+                bool_values=bool_values,
+            )
+            for key in keys
+        }
+
+    def json(self):
+        """Returns json parsed data of all available data."""
+        return json.dumps(self._data, default=_json_default)
+
+    def __call__(self, key, **kwargs):
+        return self.get(key, **kwargs)
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __hash__(self):
+        # equal snapshots have equal keys; values may be unhashable (lists)
+        if self._hash is None:
+            object.__setattr__(self, "_hash", hash(frozenset(self._data)))
+        return self._hash
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__name__} is immutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{self.__class__.__name__} is immutable.")
+
+    def __repr__(self):  # pragma: no cover
+        return f"<Snapshot keys={len(self._data)}>"
+
+
+@lru_cache(maxsize=128)
+def item_type(object_type_name):
+    """The `(key, value)` namedtuple class yielded when iterating configs.
+
+    Created once per name, so every `GConfigs` with the same
+    `object_type_name` yields items of the same class.
+    """
+    return namedtuple(object_type_name, ["key", "value"])
+
+
+def _key_matcher(patterns):
+    if isinstance(patterns, str):
+        patterns = (patterns,)
+
+    patterns = tuple(patterns)
+    if not patterns:
+        return lambda key: False
+
+    from fnmatch import translate
+
+    regex = re.compile("|".join(translate(pattern) for pattern in patterns))
+    return lambda key: regex.match(key) is not None
+
+
+def _json_default(obj):
+    if isinstance(obj, set):
+        return list(obj)
+    if isinstance(obj, (bytes, memoryview)):
+        # binary file contents, see `LocalFiles(binary=True)`. They may not be
+        # text at all (e.g. DER certificates), base64 keeps them intact.
+        import base64
+
+        return base64.b64encode(obj).decode("ascii")
+    raise TypeError
+
+
 BOOL_VALUES = (
     ("true", "false"),
     ("1", "0"),
@@ -155,6 +601,15 @@ class ValueOutput:
         self.list_sep = list_sep
         self.bool_values = bool_values
 
+    @property
+    def bool_values(self):
+        return self._bool_values
+
+    @bool_values.setter
+    def bool_values(self, bool_values):
+        self._bool_values = bool_values
+        self._bool_table = _bool_table(bool_values)
+
     def format_value(
         self, value, strip=None, cast=None, list_sep=None, bool_values=None
     ):
@@ -170,6 +625,50 @@ class ValueOutput:
 
         return value
 
+    def compile_cast(self, cast, list_sep=None, bool_values=None):
+        """Return a function `value -> casted value` for the given `cast`.
+
+        The casting strategy is chosen once, so the returned function behaves
+        like `format_value(value, strip=False, cast=cast, ...)` without
+        dispatching on `cast` for every value.
+        """
+        list_sep = self.list_sep if list_sep is None else list_sep
+        bool_values = self.bool_values if bool_values is None else bool_values
+
+        if cast is bool:
+            convert = partial(self._cast_bool, bool_values=bool_values)
+        elif cast is list:
+            convert = partial(self._cast_list, list_sep=list_sep)
+        elif cast is tuple:
+            convert = partial(self._cast_tuple, list_sep=list_sep)
+        elif cast is set:
+            convert = partial(self._cast_set, list_sep=list_sep)
+        elif cast is dict:
+            convert = self._cast_dict
+        else:
+
+            def convert(value):
+                try:
+                    return cast(value)
+                except Exception as e:
+                    raise ValueError(
+                        f"Could not cast the value '{value}' to {cast}. Error: {e}"
+                    ) from e
+
+        try:
+            isinstance(None, cast)
+        except TypeError:
+            # custom functions for casting can't be used with isinstance
+            return convert
+
+        def cast_value(value):
+            # some backends may return the value in the correct type already
+            if isinstance(value, cast):
+                return value
+            return convert(value)
+
+        return cast_value
+
     def _try_cast(self, value, cast, list_sep, bool_values):
         try:
             # some backends may return the value in the correct type already
@@ -203,12 +702,14 @@ class ValueOutput:
             return value
 
         if isinstance(value, str):
-            val = value.lower()
-            for true_val, false_val in bool_values:
-                if val == str(true_val).lower():
-                    return True
-                if val == str(false_val).lower():
-                    return False
+            if bool_values is self._bool_values:
+                table = self._bool_table
+            else:
+                table = _bool_table(bool_values)
+
+            result = table.get(value.lower())
+            if result is not None:
+                return result
 
         raise ValueError(f"Could not cast the value '{value}' to boolean.")
 
@@ -262,3 +763,23 @@ class ValueOutput:
             return json.loads(value)
 
         raise ValueError(f"Could not cast the value '{value}' to dict.")
+
+
+@lru_cache(maxsize=32)
+def _compile_bool_table(bool_values):
+    table = {}
+    # earlier pairs win, the same as checking them in order
+    for true_val, false_val in bool_values:
+        table.setdefault(str(true_val).lower(), True)
+        table.setdefault(str(false_val).lower(), False)
+    # shared by every `ValueOutput` with the same `bool_values`, so read-only
+    return MappingProxyType(table)
+
+
+def _bool_table(bool_values):
+    """Return a read-only `{lowercase string: bool}` lookup table for `bool_values`."""
+    try:
+        return _compile_bool_table(bool_values)
+    except TypeError:
+        # unhashable `bool_values` (e.g. a list) can't be cached
+        return _compile_bool_table.__wrapped__(bool_values)
@@ -0,0 +1,291 @@
+"""
+Declarative settings for gConfigs
+
+Describe all settings once and load them in a single pass, with every
+validation error reported together.
+
+Example:
+    ```python
+    import gconfigs
+    from gconfigs.schema import Field, Schema
+
+    class Settings(Schema):
+        DEBUG: bool = False
+        WORKERS: int = 2
+        ALLOWED_HOSTS: list = ["localhost"]
+        DATABASE_URL: str
+        secret_key: str = Field(key="SECRET_KEY")
+
+    settings = Settings.load(gconfigs.envs())
+    settings.WORKERS
+    ```
+
+    Or without a class, using a dict of `key -> type` or `key -> (type, default)`:
+
+    ```python
+    from gconfigs.schema import compile_schema
+
+    loader = compile_schema({"DEBUG": (bool, False), "DATABASE_URL": str})
+    values = loader.load(gconfigs.envs())  # {"DEBUG": False, "DATABASE_URL": "..."}
+    ```
+"""
+
+import types
+import typing
+
+from .gconfigs import NOTSET
+
+# generic annotations are cast with their origin, e.g. `list[str]` with `list`
+_GENERIC_CASTS = (list, tuple, set, dict)
+
+# compiled steps kept per distinct output format options
+_MAX_COMPILED = 32
+
+
+class SchemaError(ValueError):
+    """Raised by `SchemaLoader.load` with every invalid or missing setting.
+
+    Attributes:
+        errors (dict): Maps each failing field name to the exception it raised.
+    """
+
+    def __init__(self, errors):
+        self.errors = errors
+        details = "\n".join(
+            f"  - {name}: {error.__class__.__name__}: {error}"
+            for name, error in errors.items()
+        )
+        super().__init__(f"{len(errors)} invalid config(s):\n{details}")
+
+
+class Field:
+    def __init__(
+        self,
+        *,
+        default=NOTSET,
+        key=None,
+        cast=None,
+        strip=None,
+        list_sep=None,
+        bool_values=None,
+    ):
+        """Describes a single setting.
+
+        Args:
+            default: Value used when the key is missing. If not provided, the setting is required.
+            key (str): Key (Name) of config in the backend. Defaults to the field name.
+            cast (type): Type or function to cast the value with. Defaults to the annotation, if any.
+                `Optional[X]` casts with `X` and keeps `None` values.
+            strip (bool): Override the default `ValueOutput.strip` behavior.
+            list_sep (str): Override the default `ValueOutput.list_sep`.
+            bool_values (tuple): Override the default `ValueOutput.bool_values`.
+        """
+        self.default = default
+        self.key = key
+        self.cast = cast
+        self.strip = strip
+        self.list_sep = list_sep
+        self.bool_values = bool_values
+        self.name = None
+
+    def __repr__(self):  # pragma: no cover
+        return f"<Field name={self.name!r} key={self.key!r}>"
+
+
+def _normalize_cast(cast):
+    """Return `(cast, optional)` for a field cast or annotation.
+
+    `Optional[X]` and `X | None` are cast with `X`, and `optional` tells that
+    `None` is passed through as is.
+
+    Raises:
+        TypeError: If the annotation can't be used to cast, e.g. `Literal` or
+            a union of several types.
+    """
+    if cast is None or cast is typing.Any:
+        return None, False
+
+    origin = typing.get_origin(cast)
+    if origin is None:
+        return cast, False
+
+    if origin is typing.Union or origin is types.UnionType:
+        args = typing.get_args(cast)
+        not_none = [arg for arg in args if arg is not type(None)]
+        if len(not_none) == 1 and len(args) == 2:
+            return _normalize_cast(not_none[0])[0], True
+    elif origin in _GENERIC_CASTS:
+        return origin, False
+
+    raise TypeError(
+        f"{cast!r} can't be used to cast settings. Use a type, a function or "
+        "`Optional` of one of them."
+    )
+
+
+class SchemaLoader:
+    def __init__(self, fields):
+        """Loads a fixed set of `Field`s from a `GConfigs` instance.
+
+        Use `compile_schema` or `Schema` instead of creating it directly.
+
+        Raises:
+            TypeError: If the cast of a field is not supported.
+        """
+        self.fields = tuple(fields)
+        self._casts = []
+        for field in self.fields:
+            try:
+                self._casts.append(_normalize_cast(field.cast))
+            except TypeError as e:
+                raise TypeError(f"Invalid setting '{field.name}': {e}") from None
+        self._compiled = {}
+
+    def _compile(self, output_fmt):
+        # every `gconfigs.envs()` has its own `ValueOutput`, so the steps are
+        # cached by the options they depend on, not by instance
+        cache_key = (
+            type(output_fmt),
+            output_fmt.strip,
+            output_fmt.list_sep,
+            output_fmt.bool_values,
+        )
+        try:
+            steps = self._compiled.get(cache_key)
+        except TypeError:
+            # unhashable options (e.g. `bool_values` as lists), not cached
+            return self._compile_steps(output_fmt)
+
+        if steps is None:
+            steps = self._compile_steps(output_fmt)
+            if len(self._compiled) >= _MAX_COMPILED:
+                self._compiled.clear()
+            self._compiled[cache_key] = steps
+
+        return steps
+
+    def _compile_steps(self, output_fmt):
+        steps = []
+        for field, (cast, optional) in zip(self.fields, self._casts, strict=True):
+            caster = None
+            if cast is not None:
+                caster = output_fmt.compile_cast(
+                    cast, list_sep=field.list_sep, bool_values=field.bool_values
+                )
+            strip = output_fmt.strip if field.strip is None else field.strip
+            steps.append(
+                (field.name, field.key, field.default, caster, strip, optional)
+            )
+
+        return tuple(steps)
+
+    def load(self, configs):
+        """Return a dict of `field name -> value`.
+
+        Raises:
+            SchemaError: With all missing or invalid settings at once.
+        """
+        backend = configs.backend
+        lookup = getattr(backend, "lookup", None)
+        values = {}
+        errors = {}
+        steps = self._compile(configs.output_fmt)
+        for name, key, default, caster, strip, optional in steps:
+            try:
+                value = NOTSET
+                if lookup is not None and default is not NOTSET:
+                    value = lookup(key)
+                else:
+                    value = backend.get(key)
+            except Exception as e:  # noqa: BLE001
+                if default is NOTSET:
+                    errors[name] = e
+                    continue
+
+            if value is NOTSET:
+                value = default
+
+            if value is None and optional:
+                values[name] = None
+                continue
+
+            try:
+                if caster is not None:
+                    value = caster(value)
+            except Exception as e:  # noqa: BLE001
+                errors[name] = e
+                continue
+
+            if strip and isinstance(value, str):
+                value = value.strip()
+
+            values[name] = value
+
+        if errors:
+            raise SchemaError(errors)
+
+        return values
+
+
+def compile_schema(fields):
+    """Compile settings into a `SchemaLoader`.
+
+    Args:
+        fields (dict): Maps each key to a `Field`, a type (required setting)
+            or a `(type, default)` tuple.
+    """
+    compiled = []
+    for name, spec in fields.items():
+        if isinstance(spec, Field):
+            field = spec
+        elif isinstance(spec, tuple):
+            cast, default = spec
+            field = Field(cast=cast, default=default)
+        else:
+            field = Field(cast=spec)
+
+        field.name = name
+        if field.key is None:
+            field.key = name
+        compiled.append(field)
+
+    return SchemaLoader(compiled)
+
+
+class Schema:
+    """Base class for declarative settings.
+
+    Annotated class attributes are the settings: the annotation is the cast and
+    the assigned value (or a `Field`) is the default. See the module docstring.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        fields = {}
+        for name, annotation in typing.get_type_hints(cls).items():
+            if typing.get_origin(annotation) is typing.ClassVar:
+                continue
+
+            spec = getattr(cls, name, NOTSET)
+            if isinstance(spec, Field):
+                if spec.cast is None:
+                    spec.cast = annotation
+                fields[name] = spec
+            else:
+                fields[name] = Field(cast=annotation, default=spec)
+
+        cls._loader = compile_schema(fields)
+
+    @classmethod
+    def load(cls, configs):
+        """Load all settings from `configs` (a `GConfigs` instance).
+
+        Raises:
+            SchemaError: With all missing or invalid settings at once.
+        """
+        instance = cls.__new__(cls)
+        instance.__dict__.update(cls._loader.load(configs))
+        return instance
+
+    def __repr__(self):  # pragma: no cover
+        return f"<{self.__class__.__name__} {self.__dict__}>"
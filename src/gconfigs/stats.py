@@ -0,0 +1,149 @@
+"""
+Instrumentation for gConfigs
+
+`GConfigs` reports every `get` call to an optional observer. Any object with
+these two methods can be used:
+
+    - `on_get(key, backend, outcome, elapsed_ns)`: `outcome` is one of "hit"
+    (found in the backend), "miss" (not found, the error is raised), "default",
+    "use_instead" (not found, the fallback is used) or "cached" (served by a
+    `ValueCache`). `elapsed_ns` is the time spent in the backend, or None for
+    cached values.
+    - `on_cast_error(key, cast, error)`: the value couldn't be cast, `error`
+    is raised right after.
+
+Without an observer the cost is a single `is None` check per `get`.
+
+`StatsCollector` is a built-in observer keeping counters in memory.
+
+Example:
+    ```python
+    import gconfigs
+    from gconfigs.stats import StatsCollector
+
+    stats = StatsCollector()
+    secrets = gconfigs.local_files("/run/secrets")
+    secrets.observer = stats
+    ...
+    stats.as_dict()  # export to your metrics pipeline
+    ```
+"""
+
+import threading
+from bisect import bisect_left
+
+OUTCOMES = ("hit", "miss", "default", "use_instead", "cached")
+
+# upper bounds of the backend latency histogram buckets, in nanoseconds
+LATENCY_BUCKETS_NS = (
+    1_000,
+    10_000,
+    100_000,
+    1_000_000,
+    10_000_000,
+    100_000_000,
+    1_000_000_000,
+)
+
+# keys recorded after `max_keys` is reached are counted under this name
+OTHER_KEYS = "<other>"
+
+
+def _counters():
+    return dict.fromkeys(("calls", *OUTCOMES, "cast_errors"), 0)
+
+
+class StatsCollector:
+    def __init__(self, max_keys=1000):
+        """Collects per key and per backend counters of `GConfigs.get` calls.
+
+        Args:
+            max_keys (int): Maximum number of keys tracked individually, so
+                unbounded key names (e.g. `local_file` paths) can't grow memory.
+                `None` means unbounded.
+        """
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Drop everything collected so far."""
+        with self._lock:
+            self._keys = {}
+            self._backends = {}
+            self._cast_errors = {}
+
+    def _key_counters(self, key):
+        counters = self._keys.get(key)
+        if counters is None:
+            if self.max_keys is not None and len(self._keys) >= self.max_keys:
+                key = OTHER_KEYS
+            counters = self._keys.setdefault(key, _counters())
+
+        return counters
+
+    def on_get(self, key, backend, outcome, elapsed_ns):
+        name = backend.__class__.__name__
+        with self._lock:
+            counters = self._key_counters(key)
+            counters["calls"] += 1
+            counters[outcome] += 1
+
+            backend_stats = self._backends.get(name)
+            if backend_stats is None:
+                backend_stats = self._backends[name] = {
+                    "counters": _counters(),
+                    "latency_total_ns": 0,
+                    "latency_max_ns": 0,
+                    "latency_buckets": [0] * (len(LATENCY_BUCKETS_NS) + 1),
+                }
+            backend_stats["counters"]["calls"] += 1
+            backend_stats["counters"][outcome] += 1
+
+            if elapsed_ns is not None:
+                backend_stats["latency_total_ns"] += elapsed_ns
+                backend_stats["latency_max_ns"] = max(
+                    backend_stats["latency_max_ns"], elapsed_ns
+                )
+                bucket = bisect_left(LATENCY_BUCKETS_NS, elapsed_ns)
+                backend_stats["latency_buckets"][bucket] += 1
+
+    def on_cast_error(self, key, cast, error):
+        cast_name = getattr(cast, "__name__", repr(cast))
+        with self._lock:
+            self._key_counters(key)["cast_errors"] += 1
+            self._cast_errors[cast_name] = self._cast_errors.get(cast_name, 0) + 1
+
+    def as_dict(self):
+        """Return everything collected as plain, JSON serializable, dicts.
+
+        Latency buckets are keyed by their upper bound in nanoseconds (`le_<ns>`)
+        and are not cumulative. The last one, `le_inf`, has the slower calls.
+        """
+        bucket_names = [f"le_{bound}" for bound in LATENCY_BUCKETS_NS] + ["le_inf"]
+        with self._lock:
+            backends = {}
+            for name, backend_stats in self._backends.items():
+                backends[name] = {
+                    **backend_stats["counters"],
+                    "latency_ns": {
+                        "total": backend_stats["latency_total_ns"],
+                        "max": backend_stats["latency_max_ns"],
+                        "buckets": dict(
+                            zip(
+                                bucket_names,
+                                backend_stats["latency_buckets"],
+                                strict=True,
+                            )
+                        ),
+                    },
+                }
+
+            return {
+                "keys": {key: dict(counters) for key, counters in self._keys.items()},
+                "backends": backends,
+                "cast_errors": dict(self._cast_errors),
+            }
+
+    def __repr__(self):  # pragma: no cover
+        return f"<StatsCollector keys={len(self._keys)}>"
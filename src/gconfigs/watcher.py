@@ -0,0 +1,251 @@
+"""
+Hot reload for file based backends
+
+`Watcher` polls the files of `DotEnv`, `INIFile` and `TOMLFile` backends (or
+any backend with `filepath` and `load_file`) with a single `os.stat` each and
+reloads them when they change. No inotify or other dependency is required.
+Watching a `Composite` watches its file based backends and refreshes its key
+index on reload.
+
+The changed keys are found by comparing every value before and after a reload.
+Backends may implement `fingerprints()`, mapping each key to anything that
+changes with its value, to make it cheaper. Lazy `DotEnv` and `TOMLFile` use
+it, so watching them doesn't parse everything. A lazy `TOMLFile` reports the
+header path of its changed tables (e.g. `tenants.acme`) instead of their keys.
+
+Example:
+    ```python
+    import gconfigs
+    from gconfigs.watcher import Watcher
+
+    dotenvs = gconfigs.dotenvs("./config/.env")
+
+    def on_change(backend, changed_keys):
+        print(f"{backend.filepath} changed: {changed_keys}")
+
+    watcher = Watcher(interval=1.0, debounce=0.5)
+    watcher.watch(dotenvs, on_change)
+    watcher.start()
+    ...
+    watcher.stop()
+    ```
+"""
+
+import logging
+import os
+import threading
+import time
+
+from .backends import Composite, _stat_signature
+from .gconfigs import NOTSET
+
+logger = logging.getLogger(__name__)
+
+
+def _path_signature(filepath):
+    try:
+        file_stat = os.stat(filepath)
+    except OSError:
+        # missing (e.g. in the middle of a rotation), keep the current data
+        return None
+
+    return _stat_signature(file_stat)
+
+
+def _values(backend):
+    # lazy backends tell what changed without parsing/decoding every value
+    if hasattr(backend, "fingerprints"):
+        return backend.fingerprints()
+
+    keys = tuple(backend.keys())
+    if hasattr(backend, "get_many"):
+        return backend.get_many(keys)
+    return {key: backend.get(key) for key in keys}
+
+
+class _WatchedFile:
+    def __init__(self, backend):
+        self.backend = backend
+        self.callbacks = []
+        self.signature = _path_signature(backend.filepath)
+        self.values = _values(backend)
+        self.pending_signature = None
+        self.pending_since = None
+
+
+class Watcher:
+    def __init__(self, interval=1.0, debounce=0.5):
+        """Polls watched files on a background thread and reloads them on change.
+
+        Args:
+            interval (float): Seconds between polls.
+            debounce (float): A changed file is only reloaded after its signature
+                (mtime_ns, size, inode) stayed the same for this many seconds,
+                so files are not reloaded in the middle of a write.
+        """
+        self.interval = interval
+        self.debounce = debounce
+        self._watched = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def watch(self, configs, callback=None):
+        """Start watching the file of `configs` (a `GConfigs` instance or a backend).
+
+        Args:
+            callback: Optional function called as `callback(backend, changed_keys)`
+                after the file was reloaded. `changed_keys` is a set with the
+                added, removed and modified keys. For a `Composite`, `backend`
+                is the reloaded layer. Exceptions raised by it are logged, the
+                other callbacks are still called.
+        """
+        backend = getattr(configs, "backend", configs)
+        if isinstance(backend, Composite):
+            return self._watch_composite(backend, callback)
+
+        if not (hasattr(backend, "filepath") and hasattr(backend, "load_file")):
+            raise AttributeError(
+                "Only backends with 'filepath' and 'load_file' can be watched."
+            )
+
+        with self._lock:
+            for watched in self._watched:
+                if watched.backend is backend:
+                    break
+            else:
+                watched = _WatchedFile(backend)
+                self._watched.append(watched)
+
+            if callback is not None:
+                watched.callbacks.append(callback)
+
+        return backend
+
+    def _watch_composite(self, composite, callback):
+        layers = [
+            layer
+            for layer in composite.backends
+            if hasattr(layer, "filepath") and hasattr(layer, "load_file")
+        ]
+        if not layers:
+            raise AttributeError(
+                "None of the composite backends has 'filepath' and 'load_file'."
+            )
+
+        def invalidate(backend, changed_keys):
+            composite.invalidate()
+
+        # the index is dropped before `callback` sees the new values
+        for layer in layers:
+            self.watch(layer, invalidate)
+            if callback is not None:
+                self.watch(layer, callback)
+
+        return composite
+
+    def unwatch(self, configs):
+        backend = getattr(configs, "backend", configs)
+        backends = backend.backends if isinstance(backend, Composite) else (backend,)
+        with self._lock:
+            self._watched = [
+                w for w in self._watched if not any(w.backend is b for b in backends)
+            ]
+
+    def check(self):
+        """Poll every watched file once, reloading the ones that changed.
+
+        Returns:
+            dict: Maps each reloaded backend to its set of changed keys.
+        """
+        with self._lock:
+            watched_files = tuple(self._watched)
+
+        now = time.monotonic()
+        reloaded = {}
+        for watched in watched_files:
+            changed_keys = self._check_file(watched, now)
+            if changed_keys is None:
+                continue
+
+            reloaded[watched.backend] = changed_keys
+            for callback in tuple(watched.callbacks):
+                # the file is already marked as reloaded, a failing callback
+                # must not keep the others from being notified
+                try:
+                    callback(watched.backend, changed_keys)
+                except Exception:
+                    logger.exception(
+                        "Error in a callback for %s.", watched.backend.filepath
+                    )
+
+        return reloaded
+
+    def _check_file(self, watched, now):
+        signature = _path_signature(watched.backend.filepath)
+        if signature is None or signature == watched.signature:
+            watched.pending_signature = None
+            return None
+
+        if signature != watched.pending_signature:
+            watched.pending_signature = signature
+            watched.pending_since = now
+
+        if now - watched.pending_since < self.debounce:
+            return None
+
+        try:
+            # `load_file` parses everything before swapping the data in
+            watched.backend.load_file(watched.backend.filepath)
+        except Exception:
+            # probably a partial write, try again on the next change
+            logger.warning(
+                "Could not reload %s.", watched.backend.filepath, exc_info=True
+            )
+            watched.signature = signature
+            watched.pending_signature = None
+            return None
+
+        watched.signature = signature
+        watched.pending_signature = None
+        values = _values(watched.backend)
+        previous, watched.values = watched.values, values
+        return {
+            key
+            for key in previous.keys() | values.keys()
+            if previous.get(key, NOTSET) != values.get(key, NOTSET)
+        }
+
+    def start(self):
+        """Start polling on a daemon thread. Does nothing if already running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="gconfigs-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("Unexpected error while checking watched files.")
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def __repr__(self):  # pragma: no cover
+        return f"<Watcher files={len(self._watched)} interval={self.interval}>"
@@ -0,0 +1,102 @@
+"""Tests for `gconfigs.aio`."""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from gconfigs.aio import AsyncGConfigs
+from gconfigs.backends import LocalFiles
+
+from . import DummyBackend
+
+
+class ThreadTrackingBackend(DummyBackend):
+    def __init__(self):
+        super().__init__()
+        self.threads = set()
+
+    def get(self, key, **kwargs):
+        self.threads.add(threading.get_ident())
+        return super().get(key, **kwargs)
+
+
+class NativeAsyncBackend:
+    def __init__(self):
+        self.data = {"A": " 1 ", "B": "true"}
+
+    def keys(self):
+        return self.data.keys()
+
+    async def aget(self, key, **kwargs):
+        await asyncio.sleep(0)
+        if key not in self.data:
+            raise KeyError(f"'{key}' not set")
+        return self.data[key]
+
+
+def test_async_get_runs_backend_in_executor():
+    backend = ThreadTrackingBackend()
+    configs = AsyncGConfigs(backend=backend)
+
+    async def main():
+        assert await configs("CONFIG-1") == "config-1"
+        assert await configs.get("CONFIG-TRUE-STRING", cast=bool) is True
+        assert await configs.get("NON-EXISTENT-CONFIG", default="d") == "d"
+        assert await configs.get("NON-EXISTENT", use_instead="CONFIG-1") == "config-1"
+        with pytest.raises(KeyError):
+            await configs.get("NON-EXISTENT-CONFIG")
+
+        assert await configs.get_many(
+            ["CONFIG-1", "NON-EXISTENT-CONFIG"], defaults={"NON-EXISTENT-CONFIG": 1}
+        ) == {"CONFIG-1": "config-1", "NON-EXISTENT-CONFIG": 1}
+
+        keys = [item.key async for item in configs]
+        assert keys == list(backend.data)
+        assert json.loads(await configs.json())
+        assert await configs.contains("CONFIG-1")
+        assert await configs.count() == len(backend.data)
+
+    asyncio.run(main())
+    assert threading.get_ident() not in backend.threads
+
+
+def test_async_native_backend():
+    configs = AsyncGConfigs(backend=NativeAsyncBackend, object_type_name="Native")
+
+    async def main():
+        assert await configs("A", cast=int) == 1
+        assert await configs("MISSING", use_instead="B", cast=bool) is True
+        assert await configs("MISSING", default=" 2 ", cast=int) == 2
+        with pytest.raises(KeyError, match=r".*'MISSING' not set.*"):
+            await configs("MISSING")
+
+        assert await configs.get_many(["A", "B"]) == {"A": "1", "B": "true"}
+        with pytest.raises(KeyError):
+            await configs.get_many(["A", "MISSING"])
+
+        items = [item async for item in configs]
+        assert items[0].__class__.__name__ == "Native"
+        assert [(item.key, item.value) for item in items] == [("A", "1"), ("B", "true")]
+        assert [item async for item in configs.items()] == [("A", "1"), ("B", "true")]
+        assert json.loads(await configs.json()) == {"A": "1", "B": "true"}
+        assert await configs.contains("A")
+        assert await configs.count() == 2
+
+    asyncio.run(main())
+
+
+def test_async_local_files(tmp_path):
+    (tmp_path / "API_KEY").write_text("top-secret\n")
+    configs = AsyncGConfigs(backend=LocalFiles(path=tmp_path))
+
+    async def main():
+        return await configs("API_KEY")
+
+    assert asyncio.run(main()) == "top-secret"
+
+
+def test_async_invalid_backend():
+    with pytest.raises(AttributeError):
+        AsyncGConfigs(backend=object())
@@ -1,10 +1,31 @@
 """Tests for `gconfigs.backends` package."""
 
+import base64
+import configparser
+import io
+import json
 import os
+import shutil
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 import pytest
 
-from gconfigs.backends import DotEnv, File, INIFile, LocalEnv, LocalFiles, TOMLFile
+import gconfigs
+from gconfigs import backends
+from gconfigs.backends import (
+    Composite,
+    DotEnv,
+    File,
+    FileCache,
+    INIFile,
+    LocalEnv,
+    LocalFiles,
+    TOMLFile,
+)
+from gconfigs.gconfigs import NOTSET
 
 
 def test_local_env():
@@ -14,10 +35,58 @@ def test_local_env():
 
     assert "GCONFIGS_ENV_TEST" in backend.keys()
     assert backend.get("GCONFIGS_ENV_TEST") == "env-test-1"
+    assert backend.contains("GCONFIGS_ENV_TEST")
+    assert backend.get_many(["GCONFIGS_ENV_TEST", "GCONFIGS_NON-EXISTENT-ENV-KEY"]) == {
+        "GCONFIGS_ENV_TEST": "env-test-1"
+    }
+    assert backend.count() == len(os.environ)
     with pytest.raises(KeyError):
         backend.get("GCONFIGS_NON-EXISTENT-ENV-KEY")
 
 
+def test_local_env_iteration_does_not_copy_environ(monkeypatch):
+    for i in range(1000):
+        monkeypatch.setenv(f"GCONFIGS_ITER_{i}", str(i))
+
+    def fail_copy(*args, **kwargs):
+        raise AssertionError("the live environment must not be copied per batch")
+
+    monkeypatch.setattr(type(os.environ), "copy", fail_copy)
+    configs = gconfigs.envs()
+    values = dict(configs.items())
+    assert values["GCONFIGS_ITER_999"] == "999"
+    assert len(values) == len(os.environ)
+
+
+def test_local_env_snapshot(monkeypatch):
+    monkeypatch.setenv("GCONFIGS_SNAPSHOT_TEST", "before")
+    backend = LocalEnv(snapshot=True)
+    keys = backend.keys()
+
+    monkeypatch.setenv("GCONFIGS_SNAPSHOT_TEST", "after")
+    monkeypatch.setenv("GCONFIGS_SNAPSHOT_NEW", "new")
+    assert backend.get("GCONFIGS_SNAPSHOT_TEST") == "before"
+    assert not backend.contains("GCONFIGS_SNAPSHOT_NEW")
+    assert backend.lookup("GCONFIGS_SNAPSHOT_NEW") is NOTSET
+    assert backend.get_many(["GCONFIGS_SNAPSHOT_TEST"]) == {
+        "GCONFIGS_SNAPSHOT_TEST": "before"
+    }
+
+    backend.refresh()
+    assert backend.get("GCONFIGS_SNAPSHOT_TEST") == "after"
+    assert backend.count() == len(os.environ)
+    assert "GCONFIGS_SNAPSHOT_NEW" not in keys, "Old views must stay stable."
+
+    envs = gconfigs.envs(snapshot=True)
+    assert envs("GCONFIGS_SNAPSHOT_NEW") == "new"
+
+    # the default backend reads the live environment, refresh does nothing
+    live = LocalEnv()
+    live.refresh()
+    monkeypatch.setenv("GCONFIGS_SNAPSHOT_TEST", "live")
+    assert live.get("GCONFIGS_SNAPSHOT_TEST") == "live"
+
+
 def test_local_mount_file_generic():
     """Tests for `gconfigs.backends.LocalFiles` with path='./tests/files/configs'"""
     with pytest.raises(FileNotFoundError):
@@ -34,6 +103,89 @@ def test_local_mount_file_generic():
         backend.get("NON-EXISTENT-CONFIG")
 
 
+def test_local_files_contains_and_count(tmp_path):
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "b.cfg").write_text("b")
+    backend = LocalFiles(path=tmp_path, pattern="*.txt")
+
+    assert backend.contains("a.txt")
+    assert not backend.contains("b.cfg")
+    assert backend.count() == 1
+
+    # adding a file changes the directory mtime, so the listing is refreshed
+    (tmp_path / "c.txt").write_text("c")
+    os.utime(tmp_path, ns=(0, 0))
+    assert backend.contains("c.txt")
+    assert backend.count() == 2
+
+    backend.pattern = "*.cfg"
+    assert tuple(backend.keys()) == ("b.cfg",)
+
+
+def test_local_files_listing_is_cached(monkeypatch, tmp_path):
+    (tmp_path / "a").write_text("a")
+    (tmp_path / "dir").mkdir()
+    (tmp_path / "link").symlink_to(tmp_path / "a")
+    backend = LocalFiles(path=tmp_path)
+    assert set(backend.keys()) == {"a", "link"}
+
+    def fail_scandir(*args, **kwargs):
+        raise AssertionError("unchanged directory should not be listed again")
+
+    monkeypatch.setattr(os, "scandir", fail_scandir)
+    assert backend.contains("link")
+    assert backend.count() == 2
+
+
+def test_local_files_get_many(tmp_path):
+    allowed_dir = tmp_path / "allowed"
+    allowed_dir.mkdir()
+    (allowed_dir / "a").write_text("a")
+    (allowed_dir / "b").write_text("b")
+    (allowed_dir / "nested").mkdir()
+    (tmp_path / "outside-secret").write_text("outside")
+    (allowed_dir / "link").symlink_to(tmp_path / "outside-secret")
+
+    for cache in (None, FileCache()):
+        backend = LocalFiles(path=allowed_dir, cache=cache)
+        values = backend.get_many(
+            ["a", "b", "nested", "link", "../outside-secret", "NON-EXISTENT"]
+        )
+        assert values == {"a": "a", "b": "b"}
+
+
+def test_local_files_concurrent_reads_keep_key_order(monkeypatch, tmp_path):
+    names = [f"SECRET_{i:02d}" for i in range(20)]
+    for name in names:
+        (tmp_path / name).write_text(name.lower())
+
+    read_text = Path.read_text
+
+    def slow_read_text(self, *args, **kwargs):
+        # later files finish first
+        if self.name.startswith("SECRET_"):
+            time.sleep((20 - int(self.name[-2:])) / 2000)
+        return read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", slow_read_text)
+
+    keys = list(reversed(names)) + ["NON-EXISTENT"]
+    expected = {name: name.lower() for name in reversed(names)}
+
+    backend = LocalFiles(path=tmp_path, max_workers=8)
+    values = backend.get_many(keys)
+    assert list(values.items()) == list(expected.items())
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        backend = LocalFiles(path=tmp_path, executor=executor)
+        values = backend.get_many(keys)
+        assert list(values.items()) == list(expected.items())
+
+    configs = gconfigs.local_files(tmp_path, max_workers=4)
+    assert [item.key for item in configs] == list(configs.backend.keys())
+    assert {item.key: item.value for item in configs} == expected
+
+
 def test_local_files_path_traversal_is_blocked(tmp_path):
     """LocalFiles must reject keys that resolve outside its base directory."""
     allowed_dir = tmp_path / "allowed"
@@ -79,6 +231,193 @@ def test_local_files_get_unreadable_file(monkeypatch, tmp_path):
         backend.get(filepath.name)
 
 
+def test_file_cache_revalidates_with_stat(tmp_path):
+    filepath = tmp_path / "secret"
+    filepath.write_text("v1")
+    cache = FileCache()
+
+    assert cache.read(filepath) == "v1"
+    assert filepath in cache
+
+    # size changes, so the signature changes and the file is read again
+    filepath.write_text("v2-rotated")
+    assert cache.read(filepath) == "v2-rotated"
+
+    cache.invalidate(filepath)
+    assert filepath not in cache
+
+    with pytest.raises(FileNotFoundError):
+        cache.read(tmp_path / "NON-EXISTENT-FILE")
+
+    with pytest.raises(FileNotFoundError):
+        cache.read(tmp_path)
+
+
+def test_file_cache_does_not_read_unchanged_files(monkeypatch, tmp_path):
+    filepath = tmp_path / "secret"
+    filepath.write_text("top-secret")
+    cache = FileCache()
+    assert cache.read(filepath) == "top-secret"
+
+    def fail_read(*args, **kwargs):
+        raise AssertionError("unchanged file should not be read again")
+
+    monkeypatch.setattr("pathlib.Path.read_text", fail_read)
+    assert cache.read(filepath) == "top-secret"
+
+
+def test_file_cache_ttl_skips_stat(monkeypatch, tmp_path):
+    filepath = tmp_path / "secret"
+    filepath.write_text("top-secret")
+    cache = FileCache(ttl=60)
+    assert cache.read(filepath) == "top-secret"
+
+    def fail_stat(*args, **kwargs):
+        raise AssertionError("stat should not be called within the ttl")
+
+    monkeypatch.setattr(os, "stat", fail_stat)
+    assert cache.read(filepath) == "top-secret"
+
+
+def test_local_files_cache_hit_syscalls(monkeypatch, tmp_path):
+    (tmp_path / "secret").write_text("top-secret")
+    calls = []
+    for name in ("stat", "lstat"):
+        original = getattr(os, name)
+        monkeypatch.setattr(
+            os,
+            name,
+            lambda *a, _f=original, _n=name, **kw: calls.append(_n) or _f(*a, **kw),
+        )
+
+    backend = LocalFiles(tmp_path, cache=FileCache())
+    assert backend.get("secret") == "top-secret"
+    calls.clear()
+    assert backend.get("secret") == "top-secret"
+    assert calls == ["stat"], "A hit costs a single stat."
+
+    backend = LocalFiles(tmp_path, cache=FileCache(ttl=60))
+    assert backend.get("secret") == "top-secret"
+    calls.clear()
+    assert backend.get("secret") == "top-secret"
+    assert calls == [], "No syscall at all within the ttl."
+
+    # a symlink swapped to a file outside the path is caught on the next read
+    outside = tmp_path.parent / f"{tmp_path.name}-outside"
+    outside.write_text("outside")
+    (tmp_path / "link").symlink_to(tmp_path / "secret")
+    backend = LocalFiles(tmp_path, cache=FileCache())
+    assert backend.get("link") == "top-secret"
+    (tmp_path / "link").unlink()
+    (tmp_path / "link").symlink_to(outside)
+    with pytest.raises(PermissionError):
+        backend.get("link")
+    assert backend.get_many(["link", "secret"]) == {"secret": "top-secret"}
+
+
+@pytest.mark.parametrize("ttl", [None, 60])
+def test_file_cache_shared_by_file_and_local_files(tmp_path, ttl):
+    allowed_dir = tmp_path / "allowed"
+    allowed_dir.mkdir()
+    (tmp_path / "outside-secret").write_text("outside")
+    (allowed_dir / "link").symlink_to(tmp_path / "outside-secret")
+    (allowed_dir / "inside").write_text("inside")
+
+    cache = FileCache(ttl=ttl)
+    assert File(cache=cache).get(str(allowed_dir / "link")) == "outside"
+    assert File(cache=cache).get(str(allowed_dir / "inside")) == "inside"
+
+    # cached by `File`, but still checked against the LocalFiles path
+    backend = LocalFiles(allowed_dir, cache=cache)
+    with pytest.raises(PermissionError):
+        backend.get("link")
+    assert backend.get("inside") == "inside"
+    assert File(cache=cache).get(str(allowed_dir / "inside")) == "inside"
+    assert backend.get("inside") == "inside"
+
+
+def test_file_cache_lru_eviction(tmp_path):
+    cache = FileCache(maxsize=2)
+    for name in ("a", "b", "c"):
+        (tmp_path / name).write_text(name)
+        cache.read(tmp_path / name)
+
+    assert len(cache) == 2
+    assert tmp_path / "a" not in cache
+
+    cache.clear()
+    assert len(cache) == 0
+
+    with pytest.raises(ValueError):
+        FileCache(maxsize=0)
+
+
+def test_file_backends_with_cache(tmp_path):
+    (tmp_path / "password").write_text("top-secret")
+
+    backend = LocalFiles(path=tmp_path, cache=FileCache())
+    assert backend.get("password") == "top-secret"
+    assert backend.get("password") == "top-secret"
+    with pytest.raises(FileNotFoundError):
+        backend.get("NON-EXISTENT-CONFIG")
+    with pytest.raises(FileNotFoundError):
+        backend.get("../password")
+
+    backend = File(cache=FileCache())
+    assert backend.get(str(tmp_path / "password")) == "top-secret"
+    with pytest.raises(FileNotFoundError):
+        backend.get(str(tmp_path / "NON-EXISTENT-FILE"))
+
+
+def test_file_backends_binary_and_mmap(tmp_path):
+    (tmp_path / "small").write_bytes(b"\x00small")
+    (tmp_path / "large").write_bytes(b"x" * 4096)
+    (tmp_path / "empty").write_bytes(b"")
+    (tmp_path / "latin").write_bytes("café".encode("latin-1"))
+
+    backend = LocalFiles(tmp_path, encoding="latin-1")
+    assert backend.get("latin") == "café"
+
+    for cache in (None, FileCache()):
+        backend = LocalFiles(tmp_path, cache=cache, binary=True, mmap_threshold=1024)
+        assert backend.get("small") == b"\x00small"
+        assert backend.get("empty") == b""
+        large = backend.get("large")
+        assert isinstance(large, memoryview)
+        assert large.readonly
+        assert large == b"x" * 4096
+        assert backend.get_many(["small", "large"])["large"] == b"x" * 4096
+
+        backend = File(cache=cache, binary=True, mmap_threshold=1024)
+        assert isinstance(backend.get(str(tmp_path / "large")), memoryview)
+        assert backend.get(str(tmp_path / "small")) == b"\x00small"
+
+    # a cache shared by text and binary backends keeps them apart
+    cache = FileCache(ttl=60)
+    assert File(cache=cache).get(str(tmp_path / "small")) == "\x00small"
+    assert File(cache=cache, binary=True).get(str(tmp_path / "small")) == b"\x00small"
+
+    with pytest.raises(ValueError):
+        LocalFiles(tmp_path, binary=True, encoding="utf-8")
+    with pytest.raises(ValueError):
+        File(mmap_threshold=1024)
+
+
+def test_binary_values_are_base64_encoded_in_json(tmp_path):
+    certificate = b"\x30\x82\xff\xfe"
+    (tmp_path / "CERT").write_bytes(certificate)
+    (tmp_path / "LARGE").write_bytes(certificate * 1024)
+    configs = gconfigs.local_files(tmp_path, binary=True, mmap_threshold=1024)
+
+    data = json.loads(configs.json())
+    assert base64.b64decode(data["CERT"]) == certificate
+    assert base64.b64decode(data["LARGE"]) == certificate * 1024
+
+    output = io.StringIO()
+    configs.dump(output, format="jsonl", include=["CERT"])
+    assert base64.b64decode(json.loads(output.getvalue())["value"]) == certificate
+
+
 def test_dotenv():
     backend = DotEnv("./tests/files/config-files/.env")
 
@@ -98,6 +437,12 @@ def test_dotenv():
     )
 
     assert "COMMENTED-CONFIG" not in backend.keys()
+    assert backend.contains("CONFIG-1")
+    assert not backend.contains("COMMENTED-CONFIG")
+    assert backend.count() == len(backend.keys())
+    assert backend.get_many(["CONFIG-1", "COMMENTED-CONFIG"]) == {
+        "CONFIG-1": "config-1"
+    }
     assert backend.get("CONFIG-EMPTY-VALUE") == "", "Empty values must be empty string."
     assert backend.get("TEST-EMPTY-WITHOUT-NEWLINE") == "", (
         "Final line empty values must be preserved even without trailing newline."
@@ -122,6 +467,130 @@ def test_dotenv():
         backend.load_file("./tests/files/config-files/NON-EXISTENT-DOTENV-FILE")
 
 
+DOTENV_QUOTED = """\
+export EXPORTED=exported
+exportation=not-an-export-prefix
+DOUBLE="double quoted"  # a comment
+SINGLE='single \\n quoted'
+ESCAPES="tab\\tnew\\nline \\"quote\\" back\\\\slash"
+MULTILINE="-----BEGIN CERTIFICATE-----
+MIIB
+-----END CERTIFICATE-----"
+UNCLOSED="no closing quote
+AFTER_UNCLOSED=after
+TRAILING="quoted" junk
+EMPTY_QUOTED=""
+CRLF="a\r
+b"\r
+LAST=last"""
+
+
+def test_dotenv_quoted_and_multiline_values(tmp_path):
+    filepath = tmp_path / ".env"
+    filepath.write_bytes(DOTENV_QUOTED.encode())
+
+    for lazy in (False, True):
+        backend = DotEnv(filepath, lazy=lazy)
+        assert backend.get("EXPORTED") == "exported"
+        assert "export EXPORTED" not in backend.keys()
+        assert backend.get("exportation") == "not-an-export-prefix"
+        assert backend.get("DOUBLE") == "double quoted"
+        assert backend.get("SINGLE") == "single \\n quoted"
+        assert backend.get("ESCAPES") == 'tab\tnew\nline "quote" back\\slash'
+        assert backend.get("MULTILINE") == (
+            "-----BEGIN CERTIFICATE-----\nMIIB\n-----END CERTIFICATE-----"
+        )
+        # unclosed quotes are kept as is, and don't swallow the next lines
+        assert backend.get("UNCLOSED") == '"no closing quote'
+        assert backend.get("AFTER_UNCLOSED") == "after"
+        assert backend.get("TRAILING") == '"quoted" junk'
+        assert backend.get("EMPTY_QUOTED") == ""
+        assert backend.get("CRLF") == "a\nb"
+        assert backend.get("LAST") == "last"
+        assert len(backend.keys()) == 12
+
+
+def test_dotenv_only_decodes_quoted_values(tmp_path, monkeypatch):
+    filepath = tmp_path / ".env"
+    filepath.write_text('A=1\nB=plain "not quoted"\nC= "quoted"\n')
+
+    decoded = []
+    decode = backends._decode_dotenv_value
+    monkeypatch.setattr(
+        backends, "_decode_dotenv_value", lambda raw: decoded.append(raw) or decode(raw)
+    )
+
+    backend = DotEnv(filepath)
+    assert backend.get_many(["A", "B", "C"]) == {
+        "A": "1",
+        "B": 'plain "not quoted"',
+        "C": "quoted",
+    }
+    assert decoded == [' "quoted"\n']
+
+
+def test_dotenv_streams_the_file(tmp_path):
+    filepath = tmp_path / ".env"
+    # the same keys over and over, so the loaded data stays small
+    line = f"A={'x' * 100}\n# comment\n".encode()
+    filepath.write_bytes(line * 40_000)
+    size = filepath.stat().st_size
+
+    tracemalloc.start()
+    try:
+        backend = DotEnv(filepath)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert backend.get("A") == "x" * 100
+    assert peak < size / 10, f"Loading a {size} bytes file peaked at {peak} bytes."
+
+
+def test_dotenv_lazy_mode(tmp_path):
+    filepath = tmp_path / ".env"
+    filepath.write_text('A=1\nCERT="line 1\nline 2"\n')
+
+    backend = DotEnv(filepath, lazy=True)
+    assert tuple(backend.keys()) == ("A", "CERT")
+    assert backend.contains("CERT")
+    assert backend.get("CERT") == "line 1\nline 2"
+    assert backend.get_many(["A", "CERT", "B"]) == {"A": "1", "CERT": "line 1\nline 2"}
+
+    # offsets are stale once the file changes, so it's indexed again
+    backend = DotEnv(filepath, lazy=True)
+    filepath.write_text("PREFIX=something-longer\nA=2\n")
+    assert backend.get("A") == "2"
+    with pytest.raises(KeyError):
+        backend.get("CERT")
+
+
+def test_dotenv_line_endings(tmp_path):
+    filepath = tmp_path / ".env"
+    filepath.write_bytes(b'A=1\rB=2\r\nC="x\ry"\rD=4\nE=5\r')
+    expected = {"A": "1", "B": "2", "C": "x\ry", "D": "4", "E": "5"}
+
+    for lazy in (False, True):
+        backend = DotEnv(filepath, lazy=lazy)
+        assert backend.get_many(backend.keys()) == expected
+
+
+def test_dotenv_lazy_value_read_during_reload(tmp_path):
+    filepath = tmp_path / ".env"
+    filepath.write_text("A=1\nB=2\n")
+    backend = DotEnv(filepath, lazy=True)
+
+    # a reader got the lazy value, then another thread reloaded a new file
+    data = backend._data
+    stale = data["B"]
+    filepath.write_text("PREFIX=1\nB=3\n")
+    backend.load_file(filepath)
+
+    assert backend._read_value("B", stale, data) == "3"
+    assert backend.get("B") == "3"
+    assert backend._data["B"] == "3"
+
+
 def test_file_keys_returns_empty_tuple():
     backend = File()
     assert backend.keys() == tuple()
@@ -171,6 +640,14 @@ def test_ini_file():
     with pytest.raises(KeyError):
         backend.get("invalid-key-format")
 
+    assert backend.contains("database.port")
+    assert not backend.contains("database.non-existent")
+    assert backend.get_many(["app.name", "database.port", "app.non-existent"]) == {
+        "app.name": "gconfigs",
+        "database.port": "5432",
+    }
+    assert backend.count() == len(keys)
+
 
 def test_ini_file_missing_file():
     with pytest.raises(FileNotFoundError):
@@ -192,7 +669,474 @@ def test_toml_file():
     with pytest.raises(KeyError):
         backend.get("database.non-existent")
 
+    assert backend.contains("database.pool.size")
+    assert backend.get_many(
+        ["name", "database.port", "database.pool.size", "database.pool", "name.x"]
+    ) == {
+        "name": "gconfigs",
+        "database.port": 5432,
+        "database.pool.size": 10,
+        "database.pool": {"size": 10},
+    }
+    assert not backend.contains("database.pool")
+    assert backend.count() == len(keys)
+
 
 def test_toml_file_missing_file():
     with pytest.raises(FileNotFoundError):
         TOMLFile("./tests/files/config-files/NON-EXISTENT-TOML-FILE")
+
+
+LAZY_TOML = '''\
+title = "big" # [not.a.table]
+ports = [
+    8000,
+    [8001, 8002],
+]
+
+[database]
+host = "localhost"
+query = """
+[not_a_table]
+SELECT 1 \\"""
+"""
+literal = \'\'\'
+[[also_not_a_table]]\'\'\'
+
+[servers.alpha]
+ip = "10.0.0.1"
+
+[[products]]
+name = "a"
+
+[database.pool]
+size = 10
+
+[[products]]
+name = "b # [x]"
+
+["quoted.key"]
+value = 1
+'''
+
+
+def test_toml_file_lazy_mode(tmp_path):
+    filepath = tmp_path / "big.toml"
+    filepath.write_text(LAZY_TOML)
+
+    eager = TOMLFile(filepath)
+    backend = TOMLFile(filepath, lazy=True)
+
+    # tables are parsed on first access only
+    assert backend._data["title"] == "big"
+    assert backend._data["database"].__class__.__name__ == "_LazyTable"
+    assert backend.get("database.pool.size") == 10
+    assert backend._data["servers"].__class__.__name__ == "_LazyTable"
+
+    assert backend.get("database.query") == eager.get("database.query")
+    assert backend.get("products") == [{"name": "a"}, {"name": "b # [x]"}]
+    assert backend.get_many(["servers.alpha.ip", "ports", "x"]) == {
+        "servers.alpha.ip": "10.0.0.1",
+        "ports": [8000, [8001, 8002]],
+    }
+    with pytest.raises(KeyError):
+        backend.get("servers.beta.ip")
+
+    assert tuple(backend.keys()) == tuple(eager.keys())
+    assert backend._data == eager._data
+    assert backend.contains("quoted.key.value")
+    assert backend.count() == eager.count()
+
+
+def test_toml_file_lazy_table_loaded_during_reload(tmp_path):
+    filepath = tmp_path / "settings.toml"
+    filepath.write_text("[a]\nx = 1\n[b]\ny = 2\n")
+    backend = TOMLFile(filepath, lazy=True)
+
+    # a reader got the lazy table, then another thread reloaded a new file
+    data = backend._data
+    stale = data["b"]
+    filepath.write_text("[prefix]\nlonger = 'value'\n[b]\ny = 3\n")
+    backend.load_file(filepath)
+    generation = backend.generation
+
+    assert backend._load_table(data, "b", stale) == {"y": 3}
+    assert backend.generation == generation, "Already reloaded."
+    assert backend.get("b.y") == 3
+
+
+def test_toml_file_lazy_mode_parses_sub_tables_separately(tmp_path):
+    filepath = tmp_path / "tenants.toml"
+    filepath.write_text(
+        "[tenants.a]\nname = 'a'\n[tenants.a.db.pool]\nsize = 1\n"
+        "[tenants.b]\nname = 'b'\n[tenants.b.db]\nx.y = 1\n[tenants.b.db.x.z]\nw = 2\n"
+        "[tenants.c]\n[[tenants.c.items]]\nid = 1\n[tenants.c.items.meta]\nm = 1\n"
+        "[[tenants.c.items]]\nid = 2\n"
+    )
+    eager = TOMLFile(filepath)
+    backend = TOMLFile(filepath, lazy=True)
+
+    assert backend.get("tenants.a.db.pool.size") == 1
+    tenants = backend._data["tenants"]
+    assert tenants["b"].__class__.__name__ == "_LazyTable", "Siblings stay lazy."
+    assert tenants["a"]["db"]["pool"] == {"size": 1}
+
+    # defined by a dotted key and a header, parsed together
+    assert backend.get("tenants.b.db") == {"x": {"y": 1, "z": {"w": 2}}}
+    assert backend.get("tenants.c.items") == eager.get("tenants.c.items")
+    assert backend.get("tenants.c") == eager.get("tenants.c")
+
+    assert tuple(backend.keys()) == tuple(eager.keys())
+    assert backend._data == eager._data
+
+
+def test_toml_file_lazy_mode_reloads_changed_file(tmp_path):
+    filepath = tmp_path / "big.toml"
+    filepath.write_text("[a]\nvalue = 1\n[b]\nvalue = 2\n")
+
+    backend = TOMLFile(filepath, lazy=True)
+    filepath.write_text("# offsets moved\n[a]\nvalue = 10\n[c]\nvalue = 3\n")
+    assert backend.get("a.value") == 10
+    with pytest.raises(KeyError):
+        backend.get("b.value")
+
+
+def test_toml_file_lazy_mode_falls_back_to_eager_parse(tmp_path):
+    filepath = tmp_path / "big.toml"
+    # `a` is defined by a dotted key in the root table and extended by a header
+    filepath.write_text("a.x = 1\n[a.b]\ny = 2\n")
+
+    backend = TOMLFile(filepath, lazy=True)
+    assert backend._data == {"a": {"x": 1, "b": {"y": 2}}}
+    assert backend.count() == 2
+
+
+def test_toml_file_memoizes_resolved_keys(tmp_path):
+    filepath = tmp_path / "settings.toml"
+    filepath.write_text("[database.pool]\nsize = 10\n")
+
+    backend = TOMLFile(filepath)
+    pool = backend.get("database.pool")
+    assert backend.get("database.pool") is pool
+    assert backend.get_many(["database.pool.size", "database.x"]) == {
+        "database.pool.size": 10
+    }
+    assert backend._resolved == {"database.pool": pool, "database.pool.size": 10}
+
+    with pytest.raises(KeyError):
+        backend.get("database.x")
+    assert "database.x" not in backend._resolved
+
+    filepath.write_text("[database.pool]\nsize = 20\n")
+    backend.load_file(filepath)
+    assert backend._resolved == {}
+    assert backend.get("database.pool.size") == 20
+
+
+def test_ini_file_flat_index(tmp_path):
+    filepath = tmp_path / "settings.ini"
+    filepath.write_text(
+        "[DEFAULT]\n"
+        "root = /srv\n"
+        "[paths]\n"
+        "data = %(root)s/data\n"
+        "broken = %(missing)s/data\n"
+    )
+
+    backend = INIFile(filepath)
+    assert backend._values == {"paths.data": "/srv/data", "paths.root": "/srv"}
+    assert backend.get("paths.data") == "/srv/data"
+    # options are case insensitive in ConfigParser
+    assert backend.get("paths.DATA") == "/srv/data"
+    assert backend.contains("paths.broken")
+    with pytest.raises(configparser.InterpolationError):
+        backend.get("paths.broken")
+    assert backend.get_many(["paths.data", "paths.broken"]) == {
+        "paths.data": "/srv/data"
+    }
+
+    raw_backend = INIFile(filepath, raw=True)
+    assert raw_backend.get("paths.data") == "%(root)s/data"
+    assert raw_backend.get("paths.broken") == "%(missing)s/data"
+
+
+def test_composite_precedence(tmp_path, monkeypatch):
+    monkeypatch.setenv("GCONFIGS_LAYER", "env")
+    monkeypatch.delenv("GCONFIGS_DOTENV_ONLY", raising=False)
+    dotenv_file = tmp_path / ".env"
+    dotenv_file.write_text("GCONFIGS_LAYER=dotenv\nGCONFIGS_DOTENV_ONLY=dotenv\n")
+    toml_file = tmp_path / "settings.toml"
+    toml_file.write_text('GCONFIGS_LAYER = "toml"\n[database]\nport = 5432\n')
+    secret = tmp_path / "SECRET"
+    secret.write_text("secret")
+
+    env, dotenv, toml = LocalEnv(), DotEnv(dotenv_file), TOMLFile(toml_file)
+    backend = Composite([env, dotenv, toml, File])
+
+    assert backend.get("GCONFIGS_LAYER") == "env"
+    assert backend.get("GCONFIGS_DOTENV_ONLY") == "dotenv"
+    assert backend.get("database.port") == 5432
+    # not listed by any backend, looked up in order
+    assert backend.get("database") == {"port": 5432}
+    assert backend.get(str(secret)) == "secret"
+    with pytest.raises(KeyError):
+        backend.get("GCONFIGS_NON_EXISTENT")
+
+    keys = tuple(backend.keys())
+    assert keys.count("GCONFIGS_LAYER") == 1
+    assert backend.contains("database.port")
+    assert backend.count() == len(keys)
+    assert backend.get_many(["GCONFIGS_LAYER", "database.port", "x"]) == {
+        "GCONFIGS_LAYER": "env",
+        "database.port": 5432,
+    }
+
+    assert backend.explain("GCONFIGS_LAYER") == (
+        "GCONFIGS_LAYER",
+        env,
+        0,
+        (dotenv, toml),
+    )
+    assert backend.explain("database.port").layer == 2
+    with pytest.raises(KeyError):
+        backend.explain("GCONFIGS_NON_EXISTENT")
+
+    with pytest.raises(AttributeError):
+        Composite([object()])
+
+
+def test_composite_index_invalidation(tmp_path, monkeypatch):
+    monkeypatch.setenv("GCONFIGS_LAYER", "env")
+    dotenv_file = tmp_path / ".env"
+    dotenv_file.write_text("GCONFIGS_LAYER=dotenv\n")
+    dotenv = DotEnv(dotenv_file)
+
+    backend = Composite([LocalEnv, dotenv])
+    assert backend.get("GCONFIGS_LAYER") == "env"
+
+    # built again when a backend reloads
+    dotenv_file.write_text("GCONFIGS_LAYER=dotenv\nGCONFIGS_NEW=new\n")
+    dotenv.load_file(dotenv_file)
+    assert backend.contains("GCONFIGS_NEW")
+
+    # a live environment has no generation, it's a snapshot until invalidated
+    monkeypatch.setenv("GCONFIGS_NEW", "env")
+    assert backend.get("GCONFIGS_NEW") == "new"
+    backend.invalidate()
+    assert backend.get("GCONFIGS_NEW") == "env"
+
+    monkeypatch.delenv("GCONFIGS_LAYER")
+    assert backend.get("GCONFIGS_LAYER") == "dotenv", "Stale owners are skipped."
+
+
+def test_composite_index_follows_layer_reloads(tmp_path, monkeypatch):
+    high_file = tmp_path / "high.env"
+    high_file.write_text("A=high\n")
+    low_file = tmp_path / "low.env"
+    low_file.write_text("A=low\nB=low\n")
+    high, low = DotEnv(high_file), DotEnv(low_file)
+    configs = gconfigs.composite([high, low])
+    assert configs("B") == "low"
+
+    high_file.write_text("A=high\nB=high\n")
+    high.load_file(high_file)
+    assert configs("B") == "high"
+
+    env = LocalEnv(snapshot=True)
+    backend = Composite([env, low])
+    assert backend.get("B") == "low"
+    monkeypatch.setenv("B", "env")
+    env.refresh()
+    assert backend.get("B") == "env"
+
+
+def test_composite_stale_keys_are_fixed_without_rebuilding(tmp_path, monkeypatch):
+    monkeypatch.setenv("GCONFIGS_LAYER", "env")
+    monkeypatch.setenv("GCONFIGS_GONE", "env")
+    dotenv_file = tmp_path / ".env"
+    dotenv_file.write_text("GCONFIGS_LAYER=dotenv\n")
+    dotenv = DotEnv(dotenv_file)
+    backend = Composite([LocalEnv(), dotenv])
+    assert backend.get("GCONFIGS_LAYER") == "env"
+
+    listed = []
+    keys = dotenv.keys
+    monkeypatch.setattr(dotenv, "keys", lambda: listed.append(1) or keys())
+    monkeypatch.delenv("GCONFIGS_LAYER")
+    monkeypatch.delenv("GCONFIGS_GONE")
+    for _ in range(5):
+        assert backend.get("GCONFIGS_LAYER") == "dotenv"
+        assert backend.lookup("GCONFIGS_GONE") is NOTSET
+
+    assert not listed
+    assert backend.explain("GCONFIGS_LAYER").backend is dotenv
+    assert not backend.contains("GCONFIGS_GONE")
+
+
+def test_composite_raises_errors_other_than_misses(tmp_path):
+    class Unreadable:
+        def keys(self):
+            return ("SECRET",)
+
+        def get(self, key, **kwargs):
+            raise PermissionError(f"{key} is not readable.")
+
+    dotenv_file = tmp_path / ".env"
+    dotenv_file.write_text("SECRET=fallback-value\n")
+    backend = Composite([Unreadable(), DotEnv(dotenv_file)])
+    with pytest.raises(PermissionError):
+        backend.get("SECRET")
+    with pytest.raises(PermissionError):
+        Composite([Unreadable()]).get("SECRET")
+
+
+def test_backends_lookup_returns_notset_on_miss(tmp_path, monkeypatch):
+    monkeypatch.setenv("GCONFIGS_LOOKUP", "env")
+    monkeypatch.delenv("GCONFIGS_NON_EXISTENT", raising=False)
+    dotenv_file = tmp_path / ".env"
+    dotenv_file.write_text("GCONFIGS_LOOKUP=dotenv\n")
+    ini_file = tmp_path / "settings.ini"
+    ini_file.write_text("[app]\nname = ini\n")
+    toml_file = tmp_path / "settings.toml"
+    toml_file.write_text('[app]\nname = "toml"\n')
+    (tmp_path / "GCONFIGS_LOOKUP").write_text("file")
+
+    cases = [
+        (LocalEnv(), "GCONFIGS_LOOKUP", "env", "GCONFIGS_NON_EXISTENT"),
+        (DotEnv(dotenv_file), "GCONFIGS_LOOKUP", "dotenv", "GCONFIGS_NON_EXISTENT"),
+        (DotEnv(dotenv_file, lazy=True), "GCONFIGS_LOOKUP", "dotenv", "OTHER"),
+        (INIFile(ini_file), "app.name", "ini", "app.other"),
+        (INIFile(ini_file), "app.name", "ini", "invalid-key-format"),
+        (TOMLFile(toml_file), "app.name", "toml", "app.name.x"),
+        (LocalFiles(tmp_path), "GCONFIGS_LOOKUP", "file", "NON-EXISTENT"),
+        (LocalFiles(tmp_path), "GCONFIGS_LOOKUP", "file", "../NON-EXISTENT"),
+        (LocalFiles(tmp_path, cache=FileCache()), "GCONFIGS_LOOKUP", "file", "X"),
+        (File(), str(tmp_path / "GCONFIGS_LOOKUP"), "file", str(tmp_path / "X")),
+        (File(cache=FileCache()), str(tmp_path / "GCONFIGS_LOOKUP"), "file", "X"),
+        (Composite([LocalEnv, File]), "GCONFIGS_LOOKUP", "env", "X"),
+    ]
+    for backend, key, value, missing_key in cases:
+        assert backend.lookup(key) == value
+        assert backend.lookup(missing_key) is NOTSET
+        with pytest.raises((KeyError, FileNotFoundError)):
+            backend.get(missing_key)
+
+
+def make_kubernetes_volume(path, generation, files):
+    """Lay out `files` like a ConfigMap volume, pointing `..data` to `generation`."""
+    generation_dir = path / generation
+    generation_dir.mkdir()
+    for name, content in files.items():
+        (generation_dir / name).write_text(content)
+        if not (path / name).is_symlink():
+            (path / name).symlink_to(f"..data/{name}")
+
+    (path / "..data_tmp").symlink_to(generation)
+    os.replace(path / "..data_tmp", path / "..data")
+    return generation_dir
+
+
+def test_local_files_atomic_kubernetes_volume(tmp_path):
+    first = make_kubernetes_volume(
+        tmp_path, "..2026_01", {"A": "a1", "B": "b1", "D": "d1"}
+    )
+    backend = LocalFiles(tmp_path, atomic=True)
+
+    assert set(backend.keys()) == {"A", "B", "D"}
+    assert backend.get("A") == "a1"
+    generation = backend.generation
+
+    # values are read once per generation
+    (first / "A").write_text("changed in place")
+    assert backend.get_many(["A", "B"]) == {"A": "a1", "B": "b1"}
+    assert backend.generation == generation
+
+    make_kubernetes_volume(
+        tmp_path, "..2026_02", {"A": "a2", "B": "b2", "C": "c2", "D": "d2"}
+    )
+    old_volume = backend._volume
+    shutil.rmtree(first)
+    assert backend.get_many(["A", "B", "C"]) == {"A": "a2", "B": "b2", "C": "c2"}
+    assert backend.generation != generation
+    assert backend.count() == 4
+    assert backend.lookup("..data") is NOTSET
+    with pytest.raises(FileNotFoundError):
+        backend.get("../A")
+
+    # a reader that started on the removed generation moves to the new one
+    # instead of mixing both
+    assert backend._lookup_in_volume(old_volume, "D") == "d2"
+    assert backend._get_many_from_volume(old_volume, ("A", "D")) == {
+        "A": "a2",
+        "D": "d2",
+    }
+
+
+def test_local_files_atomic_without_kubernetes_volume(tmp_path):
+    (tmp_path / "A").write_text("a")
+    backend = LocalFiles(tmp_path, atomic=True)
+    assert backend.generation is None
+    assert tuple(backend.keys()) == ("A",)
+    assert backend.get("A") == "a"
+
+
+def test_local_files_atomic_rejects_data_link_outside_path(tmp_path):
+    volume = tmp_path / "volume"
+    volume.mkdir()
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    (elsewhere / "passwd").write_text("root:x:0:0")
+
+    for target in (elsewhere, "../elsewhere"):
+        (volume / "..data").symlink_to(target)
+        backend = LocalFiles(volume, atomic=True)
+        assert backend.generation is None
+        assert backend.lookup("passwd") is NOTSET
+        with pytest.raises(FileNotFoundError):
+            backend.get("passwd")
+        (volume / "..data").unlink()
+
+
+def test_local_files_lookup_still_raises_on_path_escape(tmp_path):
+    backend = LocalFiles(tmp_path)
+    (tmp_path / "link").symlink_to(tmp_path.parent)
+    with pytest.raises(PermissionError):
+        backend.lookup("link")
+
+
+def test_backends_generation_changes_on_reload(tmp_path, monkeypatch):
+    dotenv_file = tmp_path / ".env"
+    dotenv_file.write_text("A=1\n")
+    ini_file = tmp_path / "settings.ini"
+    ini_file.write_text("[app]\nname = ini\n")
+    toml_file = tmp_path / "settings.toml"
+    toml_file.write_text('[app]\nname = "toml"\n')
+
+    dotenv = DotEnv(dotenv_file)
+    backend = Composite([LocalEnv(snapshot=True), dotenv])
+    generation = backend.generation
+    dotenv.load_file(dotenv_file)
+    assert backend.generation != generation
+
+    generation = backend.generation
+    backend.backends[0].refresh()
+    assert backend.generation != generation
+
+    generation = backend.generation
+    backend.invalidate()
+    assert backend.generation != generation
+
+    for file_backend, filepath in (
+        (INIFile(ini_file), ini_file),
+        (TOMLFile(toml_file), toml_file),
+    ):
+        generation = file_backend.generation
+        file_backend.load_file(filepath)
+        assert file_backend.generation == generation + 1
+
+    configs = gconfigs.dotenvs(dotenv_file)
+    configs.cache = gconfigs.gconfigs.ValueCache()
+    assert configs("A", cast=int) == 1
+    dotenv_file.write_text("A=2\n")
+    configs.backend.load_file(dotenv_file)
+    assert configs("A", cast=int) == 2
@@ -0,0 +1,32 @@
+"""Smoke tests for `gconfigs.bench`, the benchmarks themselves are not run here."""
+
+import json
+
+from gconfigs import bench
+
+
+def test_bench_report():
+    report = bench.run(scale=0.001, select="get", repeat=1, min_time=0.001)
+
+    assert "get.LocalFiles" in report["results"]
+    assert "cast.bool" not in report["results"]
+    for stats in report["results"].values():
+        assert stats["min_ns"] > 0
+        assert stats["calls"] >= 1
+
+
+def test_bench_main_output_and_compare(tmp_path, capsys):
+    output = tmp_path / "report.json"
+    bench.main(["-k", "load", "--scale", "0.001", "--repeat", "1", "-o", str(output)])
+
+    report = json.loads(output.read_text())
+    assert set(report["results"]) == {
+        "load.DotEnv",
+        "load.INIFile",
+        "load.TOMLFile",
+        "load.TOMLFile.lazy",
+    }
+
+    lines = bench.compare(report, report)
+    assert len(lines) == 4
+    assert all(line.endswith("1.00x") for line in lines)
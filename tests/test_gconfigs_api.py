@@ -4,12 +4,21 @@ act like a restriction to things I think, at the moment, that we may have to
 talk before changing the way it's implemented.
 """
 
+import io
 import json
 
 import pytest
 
 import gconfigs as gconfigs
-from gconfigs.gconfigs import GConfigs, ValueOutput
+from gconfigs.gconfigs import (
+    BOOL_VALUES,
+    NOTSET,
+    REDACTED,
+    GConfigs,
+    ValueCache,
+    ValueOutput,
+    item_type,
+)
 
 from . import DummyBackend
 
@@ -32,6 +41,7 @@ def test_bad_instatiation():
 
 def test_defaults():
     # api main endpoints
+    gconfigs.composite
     gconfigs.envs
     gconfigs.dotenvs
     gconfigs.ini_file
@@ -88,6 +98,36 @@ def test_get_configs_info():
     assert configs("NON-EXISTENT-CONFIG", default=False) is False
 
 
+def test_contains_and_len_use_backend_fast_path():
+    class IndexedBackend(DummyBackend):
+        def contains(self, key):
+            return key == "INDEXED"
+
+        def count(self):
+            return 42
+
+        def keys(self):
+            raise AssertionError("keys() should not be scanned")
+
+    configs = GConfigs(backend=IndexedBackend)
+    assert "INDEXED" in configs
+    assert "CONFIG-1" not in configs
+    assert len(configs) == 42
+
+
+def test_len_with_generator_keys():
+    class GeneratorBackend:
+        def keys(self):
+            yield from ("A", "B", "C")
+
+        def get(self, key, **kwargs):
+            return key
+
+    configs = GConfigs(backend=GeneratorBackend)
+    assert len(configs) == 3
+    assert "B" in configs
+
+
 def test_get_is_keyword_only_for_default_and_options():
     """Check if `get` method is properly enforcing the keyword only arguments
     after the `key` argument."""
@@ -325,6 +365,278 @@ def test_json():
     )
 
 
+def test_get_many():
+    configs = GConfigs(backend=DummyBackend)
+
+    values = configs.get_many(
+        ["CONFIG-1", " white space key ", "NON-EXISTENT-CONFIG"],
+        defaults={"NON-EXISTENT-CONFIG": "default"},
+    )
+    assert values == {
+        "CONFIG-1": "config-1",
+        " white space key ": "white space value",
+        "NON-EXISTENT-CONFIG": "default",
+    }
+
+    assert configs.get_many(["CONFIG-TRUE-STRING", "CONFIG-FALSE"], cast=bool) == {
+        "CONFIG-TRUE-STRING": True,
+        "CONFIG-FALSE": False,
+    }
+
+    with pytest.raises(KeyError):
+        configs.get_many(["CONFIG-1", "NON-EXISTENT-CONFIG"])
+
+    snapshot = configs.snapshot()
+    assert snapshot.get_many(
+        ["CONFIG-1", "NON-EXISTENT-CONFIG"],
+        defaults={"NON-EXISTENT-CONFIG": "default"},
+    ) == {"CONFIG-1": "config-1", "NON-EXISTENT-CONFIG": "default"}
+
+
+def test_get_many_uses_backend_bulk_fetch():
+    class BulkBackend:
+        def __init__(self):
+            self.calls = []
+
+        def keys(self):
+            return ["A", "B"]
+
+        def get(self, key, **kwargs):
+            self.calls.append(("get", key))
+            raise KeyError(f"'{key}' not set")
+
+        def get_many(self, keys, **kwargs):
+            self.calls.append(("get_many", keys))
+            return {"A": " 1 ", "B": "2"}
+
+    backend = BulkBackend()
+    configs = GConfigs(backend=backend)
+
+    assert configs.get_many(["A", "B"], cast=int) == {"A": 1, "B": 2}
+    assert backend.calls == [("get_many", ("A", "B"))]
+
+    # keys the backend didn't return are retried with `get` for a proper error
+    with pytest.raises(KeyError, match=r".*'C' not set.*"):
+        configs.get_many(["A", "C"])
+
+
+def test_get_prefers_backend_lookup_for_misses():
+    class LookupBackend:
+        def __init__(self):
+            self.calls = []
+            self.data = {"A": " 1 "}
+
+        def keys(self):
+            return self.data.keys()
+
+        def get(self, key, **kwargs):
+            self.calls.append(("get", key))
+            if key not in self.data:
+                raise KeyError(f"'{key}' not set")
+            return self.data[key]
+
+        def lookup(self, key, **kwargs):
+            self.calls.append(("lookup", key))
+            return self.data.get(key, NOTSET)
+
+    backend = LookupBackend()
+    configs = GConfigs(backend=backend)
+
+    assert configs("A", cast=int) == 1
+    assert configs("B", default="2", cast=int) == 2
+    assert configs("B", use_instead="A", cast=int) == 1
+    assert configs.get_many(["A", "B"], defaults={"B": None}) == {"A": "1", "B": None}
+    assert ("get", "B") not in backend.calls, "Misses with fallbacks must not raise."
+
+    # without a fallback the backend's own error is raised
+    with pytest.raises(KeyError, match=r".*'B' not set.*"):
+        configs("B")
+    with pytest.raises(KeyError, match=r".*'B' not set.*"):
+        configs.get_many(["B"])
+
+
+def test_item_type_is_created_once_per_name():
+    configs = GConfigs(backend=DummyBackend, object_type_name="DummyConfig")
+    other = GConfigs(backend=DummyBackend, object_type_name="DummyConfig")
+
+    first = next(configs.iterator())
+    assert type(first) is type(next(other.iterator())) is item_type("DummyConfig")
+    assert type(first) is not item_type("KeyValue")
+
+    items = list(configs.items())
+    assert all(type(item) is tuple for item in items)
+    assert items == [tuple(item) for item in configs.iterator()]
+    assert dict(items)["CONFIG-1"] == "config-1"
+
+
+def test_dump_streams_filtered_and_redacted_configs(monkeypatch):
+    class BulkBackend:
+        def __init__(self):
+            self.requested = []
+            self.data = {"APP_NAME": "app", "APP_SECRET": "s3cr3t", "DEBUG": "true"}
+
+        def keys(self):
+            return self.data.keys()
+
+        def get(self, key, **kwargs):
+            return self.data[key]
+
+        def get_many(self, keys, **kwargs):
+            keys = tuple(keys)
+            self.requested.append(keys)
+            return {key: self.data[key] for key in keys}
+
+    monkeypatch.setattr(gconfigs.gconfigs, "_BATCH_SIZE", 2)
+    backend = BulkBackend()
+    configs = GConfigs(backend=backend)
+
+    output = io.StringIO()
+    configs.dump(output)
+    assert output.getvalue() == configs.json() == json.dumps(backend.data)
+    assert backend.requested[:2] == [("APP_NAME", "APP_SECRET"), ("DEBUG",)]
+
+    backend.requested.clear()
+    output = io.StringIO()
+    configs.dump(output, include="APP_*", redact=["*SECRET*", "*PASSWORD*"])
+    assert json.loads(output.getvalue()) == {
+        "APP_NAME": "app",
+        "APP_SECRET": REDACTED,
+    }
+    assert backend.requested == [("APP_NAME",)], "Redacted values must not be read."
+
+    output = io.StringIO()
+    configs.dump(output, format="jsonl", include=["DEBUG"])
+    assert output.getvalue() == '{"key": "DEBUG", "value": "true"}\n'
+
+    output = io.StringIO()
+    GConfigs(backend=DummyBackend).dump(output, include=(), format="json")
+    assert output.getvalue() == "{}"
+
+    with pytest.raises(ValueError, match=r".*Unsupported dump format 'yaml'.*"):
+        configs.dump(io.StringIO(), format="yaml")
+
+
+def test_value_cache(monkeypatch):
+    class CountingBackend:
+        def __init__(self):
+            self.generation = 0
+            self.calls = 0
+            self.data = {"WORKERS": "4"}
+
+        def keys(self):
+            return self.data.keys()
+
+        def get(self, key, **kwargs):
+            self.calls += 1
+            return self.data[key]
+
+    backend = CountingBackend()
+    cache = ValueCache(maxsize=2)
+    configs = GConfigs(backend=backend, cache=cache)
+
+    assert configs("WORKERS", cast=int) == 4
+    assert configs("WORKERS", cast=int) == 4
+    assert configs("WORKERS") == "4"
+    assert backend.calls == 2, "Each set of options is cached separately."
+
+    # defaults are not cached
+    assert configs("MISSING", default="x") == "x"
+    backend.data["MISSING"] = "set later"
+    assert configs("MISSING", default="x") == "set later"
+    assert len(cache) == 2, "The oldest entry must be evicted."
+    calls = backend.calls
+    assert configs("WORKERS", cast=int) == 4
+    assert backend.calls == calls + 1
+
+    # unhashable options are just not cached
+    assert configs("WORKERS", bool_values=[("4", "0")], cast=bool) is True
+
+    backend.data["WORKERS"] = "8"
+    assert configs("WORKERS", cast=int) == 4
+    backend.generation += 1
+    assert configs("WORKERS", cast=int) == 8, "Reloaded backends invalidate values."
+
+    backend.data["WORKERS"] = "16"
+    cache.invalidate("WORKERS")
+    assert configs("WORKERS", cast=int) == 16
+
+    with pytest.raises(ValueError):
+        ValueCache(maxsize=0)
+
+
+def test_value_cache_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(gconfigs.gconfigs.time, "monotonic", lambda: now[0])
+    data = {"A": "1"}
+    cache = ValueCache(ttl=10)
+    configs = GConfigs(backend=DummyBackend, cache=cache)
+    configs.backend.get = lambda key, **kwargs: data[key]
+
+    assert configs("A") == "1"
+    data["A"] = "2"
+    now[0] += 9
+    assert configs("A") == "1"
+    now[0] += 1
+    assert configs("A") == "2"
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_snapshot():
+    configs = GConfigs(backend=DummyBackend)
+    snapshot = configs.snapshot()
+
+    assert len(snapshot) == len(configs)
+    assert "CONFIG-1" in snapshot
+    assert snapshot["CONFIG-1"] == snapshot("CONFIG-1") == "config-1"
+    for key in configs.backend.data:
+        assert snapshot.get(key) == configs.get(key)
+
+    # same call surface as GConfigs
+    assert snapshot.get(" white space key ") == "white space value"
+    assert snapshot.get(" white space key ", strip=False) == " white space value "
+    assert snapshot.get("CONFIG-TRUE-STRING", cast=bool) is True
+    assert snapshot.get("NON-EXISTENT-CONFIG", default=" 1 ", cast=int) == 1
+    assert snapshot.get("NON-EXISTENT-CONFIG", use_instead="CONFIG-1") == "config-1"
+    with pytest.raises(KeyError):
+        snapshot.get("NON-EXISTENT-CONFIG")
+    with pytest.raises(TypeError):
+        snapshot.get("CONFIG-1", "default")
+
+    assert json.loads(snapshot.json()) == json.loads(configs.json())
+
+
+def test_snapshot_is_immutable_and_hashable():
+    snapshot = GConfigs(backend=DummyBackend).snapshot()
+
+    with pytest.raises(TypeError):
+        snapshot["CONFIG-1"] = "changed"
+    with pytest.raises(AttributeError):
+        snapshot.output_fmt = None
+    with pytest.raises(AttributeError):
+        snapshot.new_attribute = "value"
+
+    other = GConfigs(backend=DummyBackend).snapshot()
+    assert snapshot == other
+    assert hash(snapshot) == hash(other)
+    assert {snapshot: "ok"}[other] == "ok"
+
+
+def test_snapshot_does_not_call_backend_after_creation():
+    class CountingBackend(DummyBackend):
+        calls = 0
+
+        def get(self, key, **kwargs):
+            CountingBackend.calls += 1
+            return super().get(key, **kwargs)
+
+    snapshot = GConfigs(backend=CountingBackend).snapshot()
+    calls = CountingBackend.calls
+    snapshot.get("CONFIG-1")
+    snapshot.get("CONFIG-INT", cast=str)
+    assert CountingBackend.calls == calls
+
+
 # gconfigs.ValueOutput tests
 # CASTING TYPES TESTS
 
@@ -376,6 +688,31 @@ def test_cast_boolean_based_on_BOOLEAN_VALUES():
         out_fmt.format_value("invalid", cast=bool)
 
 
+def test_cast_boolean_custom_bool_values():
+    out_fmt = ValueOutput(bool_values=(("Enabled", "Disabled"),))
+    assert out_fmt.format_value("ENABLED", cast=bool) is True
+    assert out_fmt.format_value("disabled", cast=bool) is False
+    with pytest.raises(ValueError, match=r".*Could not cast the value.*"):
+        out_fmt.format_value("true", cast=bool)
+
+    # per-call override, including unhashable bool_values
+    assert out_fmt.format_value("true", cast=bool, bool_values=BOOL_VALUES) is True
+    assert out_fmt.format_value("sim", cast=bool, bool_values=[["sim", "nao"]])
+
+    # earlier pairs take precedence
+    bool_values = (("x", "y"), ("y", "x"))
+    assert out_fmt.format_value("y", cast=bool, bool_values=bool_values) is False
+
+    # changing the attribute must be honored
+    out_fmt.bool_values = (("ja", "nein"),)
+    assert out_fmt.format_value("nein", cast=bool) is False
+
+    # the table is shared by every ValueOutput with the same bool_values
+    with pytest.raises(TypeError):
+        out_fmt._bool_table["nope"] = True
+    assert ValueOutput(bool_values=(("ja", "nein"),))._bool_table.get("nope") is None
+
+
 def test_cast_list_builtin_types():
     out_fmt = ValueOutput()
     assert out_fmt.format_value([1, 1.1, "a"], cast=list) == [1, 1.1, "a"]
@@ -523,6 +860,25 @@ def test_custom_cast_decimal():
         out_fmt.format_value("invalid", cast=Decimal)
 
 
+def test_compile_cast_matches_format_value():
+    out_fmt = ValueOutput()
+    values = ("true", "off", True, "1,2", '["a"]', '{"a": 1}', "1", 1, (1, 2))
+    for cast in (bool, list, tuple, set, dict, int, str):
+        compiled = out_fmt.compile_cast(cast)
+        for value in values:
+            try:
+                expected = out_fmt.format_value(value, strip=False, cast=cast)
+            except ValueError:
+                with pytest.raises(ValueError):
+                    compiled(value)
+                continue
+            assert compiled(value) == expected
+
+    assert out_fmt.compile_cast(list, list_sep=";")("a;b") == ["a", "b"]
+    enabled = out_fmt.compile_cast(bool, bool_values=(("enabled", "disabled"),))
+    assert enabled("Enabled") is True
+
+
 # STRIP TESTS
 def test_strip_value_by_default():
     out_fmt = ValueOutput()
@@ -0,0 +1,89 @@
+"""Import time regression tests for `gconfigs`."""
+
+import json
+import subprocess
+import sys
+
+# cumulative `python -X importtime` budget of `import gconfigs`, in microseconds.
+# It's about 2ms, most of the margin is for slow CI machines.
+IMPORT_BUDGET_US = 30_000
+
+# only loaded when the feature that needs them is used
+LAZY_MODULES = (
+    "importlib.metadata",
+    "configparser",
+    "tomllib",
+    "concurrent.futures",
+    "fnmatch",
+    "mmap",
+    "pathlib",
+)
+
+
+def run_python(code):
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+
+def loaded_modules(code):
+    output = run_python(
+        f"{code}\nimport json, sys\nprint(json.dumps(list(sys.modules)))"
+    )
+    return set(json.loads(output.stdout))
+
+
+def test_import_time_budget():
+    stderr = run_python("import gconfigs").stderr
+    # lines look like: "import time:  self [us] | cumulative | imported package"
+    cumulative = {
+        name.strip(): int(total)
+        for _, total, name in (
+            line.split(":", 1)[1].split("|") for line in stderr.splitlines()[1:]
+        )
+    }
+    assert cumulative["gconfigs"] < IMPORT_BUDGET_US, (
+        f"`import gconfigs` took {cumulative['gconfigs']}us."
+    )
+
+
+def test_import_defers_heavy_modules():
+    modules = loaded_modules("import gconfigs")
+    assert "gconfigs.backends" not in modules
+    assert not modules & set(LAZY_MODULES)
+
+    modules = loaded_modules("import gconfigs\ngconfigs.envs()('PATH')")
+    assert "gconfigs.backends" in modules
+    assert not modules & set(LAZY_MODULES)
+
+
+def test_submodules_resolve_lazily():
+    modules = loaded_modules(
+        "import gconfigs\n"
+        "import sys\n"
+        "assert 'gconfigs.backends' not in sys.modules\n"
+        "assert gconfigs.backends.FileCache\n"
+        "assert gconfigs.gconfigs.NOTSET is gconfigs.backends.NOTSET\n"
+        "assert gconfigs.api.envs is gconfigs.envs"
+    )
+    assert {"gconfigs.api", "gconfigs.backends", "gconfigs.gconfigs"} <= modules
+    assert "gconfigs.schema" not in modules
+
+
+def test_lazy_attributes():
+    import gconfigs
+    from gconfigs import api
+
+    assert gconfigs.envs is api.envs
+    assert isinstance(gconfigs.__version__, str)
+    assert {"envs", "__version__"} <= set(dir(gconfigs))
+
+    try:
+        gconfigs.non_existent  # noqa: B018
+    except AttributeError as e:
+        assert "non_existent" in str(e)
+    else:  # pragma: no cover
+        raise AssertionError("AttributeError not raised.")
@@ -0,0 +1,103 @@
+"""Tests for `gconfigs.schema`."""
+
+from typing import Literal, Optional
+
+import pytest
+
+from gconfigs.gconfigs import GConfigs, ValueOutput
+from gconfigs.schema import Field, Schema, SchemaError, compile_schema
+
+from . import DummyBackend
+
+
+def test_schema_class_loads_typed_settings():
+    class Settings(Schema):
+        CONFIG_1: str = Field(key="CONFIG-1")
+        TRUE: bool = Field(key="CONFIG-TRUE-STRING")
+        NUMBERS: list[str] = Field(key="CONFIG-LIST-STRING-JSON-STYLE")
+        WORKERS: int = "2"
+        VALUE: str = Field(key=" white space key ", strip=False)
+
+    settings = Settings.load(GConfigs(backend=DummyBackend))
+
+    assert settings.CONFIG_1 == "config-1"
+    assert settings.TRUE is True
+    assert settings.NUMBERS == [1, 1.1, "a"]
+    assert settings.WORKERS == 2, "Defaults must be casted like `GConfigs.get`."
+    assert settings.VALUE == " white space value "
+
+
+def test_schema_dict_loads_settings():
+    loader = compile_schema(
+        {
+            "CONFIG-INT": str,
+            "CONFIG-1": (str, "default"),
+            "NON-EXISTENT-CONFIG": (bool, "on"),
+            "CONFIG-DICT-JSON-STYLE": dict,
+        }
+    )
+
+    assert loader.load(GConfigs(backend=DummyBackend)) == {
+        "CONFIG-INT": "1",
+        "CONFIG-1": "config-1",
+        "NON-EXISTENT-CONFIG": True,
+        "CONFIG-DICT-JSON-STYLE": {"a": 1, "b": "b"},
+    }
+
+
+def test_schema_reports_every_error_at_once():
+    class Settings(Schema):
+        MISSING: str
+        INVALID_INT: int = Field(key="CONFIG-1")
+        INVALID_BOOL: bool = Field(key="CONFIG-1")
+        VALID: str = Field(key="CONFIG-1")
+
+    with pytest.raises(SchemaError) as exc_info:
+        Settings.load(GConfigs(backend=DummyBackend))
+
+    errors = exc_info.value.errors
+    assert set(errors) == {"MISSING", "INVALID_INT", "INVALID_BOOL"}
+    assert isinstance(errors["MISSING"], KeyError)
+    assert "MISSING" in str(exc_info.value)
+    assert isinstance(exc_info.value, ValueError)
+
+
+def test_schema_uses_output_fmt_options():
+    class Settings(Schema):
+        HOSTS: list = Field(key="CONFIG-1")
+
+    configs = GConfigs(backend=DummyBackend, output_fmt=ValueOutput(list_sep="-"))
+    assert Settings.load(configs).HOSTS == ["config", "1"]
+
+
+def test_schema_optional_settings():
+    class Settings(Schema):
+        TIMEOUT: Optional[int] = None  # noqa: UP045
+        RETRIES: int | None = Field(key="CONFIG-INT", default=None)
+        HOSTS: list[str] | None = None
+
+    settings = Settings.load(GConfigs(backend=DummyBackend))
+    assert settings.TIMEOUT is None
+    assert settings.RETRIES == 1
+    assert settings.HOSTS is None
+
+
+def test_schema_rejects_unsupported_annotations():
+    with pytest.raises(TypeError, match="MODE"):
+
+        class Settings(Schema):
+            MODE: Literal["dev", "prod"] = "dev"
+
+    with pytest.raises(TypeError):
+        compile_schema({"PORT": int | str})
+
+
+def test_schema_compiles_once_per_output_options():
+    loader = compile_schema({"CONFIG-INT": int})
+    for _ in range(10):
+        assert loader.load(GConfigs(backend=DummyBackend)) == {"CONFIG-INT": 1}
+    assert len(loader._compiled) == 1
+
+    configs = GConfigs(backend=DummyBackend, output_fmt=ValueOutput(list_sep="-"))
+    loader.load(configs)
+    assert len(loader._compiled) == 2
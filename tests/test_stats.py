@@ -0,0 +1,66 @@
+"""Tests for `gconfigs.stats`."""
+
+import json
+
+import pytest
+
+from gconfigs.gconfigs import GConfigs, ValueCache
+from gconfigs.stats import StatsCollector
+
+from . import DummyBackend
+
+
+def test_stats_collector_records_get_outcomes():
+    stats = StatsCollector()
+    configs = GConfigs(backend=DummyBackend, observer=stats)
+
+    assert configs("CONFIG-1") == "config-1"
+    assert configs("CONFIG-INT", cast=int) == 1
+    assert configs("MISSING", default="x") == "x"
+    assert configs("MISSING", use_instead="CONFIG-1") == "config-1"
+    with pytest.raises(KeyError):
+        configs("MISSING")
+    with pytest.raises(ValueError):
+        configs("CONFIG-1", cast=int)
+
+    report = stats.as_dict()
+    json.dumps(report)
+
+    assert report["keys"]["CONFIG-1"] == {
+        "calls": 3,
+        "hit": 3,
+        "miss": 0,
+        "default": 0,
+        "use_instead": 0,
+        "cached": 0,
+        "cast_errors": 1,
+    }
+    missing = report["keys"]["MISSING"]
+    assert (missing["default"], missing["use_instead"], missing["miss"]) == (1, 1, 1)
+
+    backend = report["backends"]["DummyBackend"]
+    assert backend["calls"] == 7
+    assert sum(backend["latency_ns"]["buckets"].values()) == 7
+    assert backend["latency_ns"]["max"] <= backend["latency_ns"]["total"]
+    assert list(backend["latency_ns"]["buckets"])[-1] == "le_inf"
+    assert report["cast_errors"] == {"int": 1}
+
+    stats.reset()
+    assert stats.as_dict() == {"keys": {}, "backends": {}, "cast_errors": {}}
+
+
+def test_stats_collector_cached_values_and_key_bound():
+    stats = StatsCollector(max_keys=1)
+    configs = GConfigs(backend=DummyBackend, cache=ValueCache(), observer=stats)
+
+    configs("CONFIG-1")
+    configs("CONFIG-1")
+    configs("CONFIG-INT")
+
+    report = stats.as_dict()
+    assert report["keys"]["CONFIG-1"]["cached"] == 1
+    assert report["keys"]["<other>"]["calls"] == 1
+    backend = report["backends"]["DummyBackend"]
+    assert sum(backend["latency_ns"]["buckets"].values()) == 2, (
+        "Cached values have no backend latency."
+    )
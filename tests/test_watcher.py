@@ -0,0 +1,176 @@
+"""Tests for `gconfigs.watcher`."""
+
+import os
+import time
+
+import pytest
+
+import gconfigs
+from gconfigs import backends
+from gconfigs.backends import DotEnv, LocalEnv, TOMLFile
+from gconfigs.watcher import Watcher
+
+
+def write(filepath, content):
+    filepath.write_text(content)
+    # make sure the signature changes even on filesystems with coarse mtime
+    stat = os.stat(filepath)
+    os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_watcher_reloads_changed_files(tmp_path):
+    dotenv_file = tmp_path / ".env"
+    write(dotenv_file, "A=1\nB=2\n")
+    dotenvs = gconfigs.dotenvs(dotenv_file)
+
+    changes = []
+    watcher = Watcher(debounce=0)
+    watcher.watch(dotenvs, lambda backend, keys: changes.append((backend, keys)))
+
+    assert watcher.check() == {}
+
+    write(dotenv_file, "A=1\nB=changed\nC=3\n")
+    assert watcher.check() == {dotenvs.backend: {"B", "C"}}
+    assert dotenvs("B") == "changed"
+    assert changes == [(dotenvs.backend, {"B", "C"})]
+
+    write(dotenv_file, "A=1\n")
+    assert watcher.check() == {dotenvs.backend: {"B", "C"}}
+    assert "B" not in dotenvs
+
+    watcher.unwatch(dotenvs)
+    write(dotenv_file, "A=2\n")
+    assert watcher.check() == {}
+
+
+def test_watcher_debounces_changes(tmp_path):
+    toml_file = tmp_path / "settings.toml"
+    write(toml_file, "port = 1\n")
+    backend = TOMLFile(toml_file)
+
+    watcher = Watcher(debounce=0.05)
+    watcher.watch(backend)
+
+    write(toml_file, "port = 2\n")
+    assert watcher.check() == {}, "Must wait for the file to be stable."
+    time.sleep(0.06)
+    assert watcher.check() == {backend: {"port"}}
+    assert backend.get("port") == 2
+
+
+def test_watcher_keeps_data_when_file_is_invalid_or_missing(tmp_path):
+    toml_file = tmp_path / "settings.toml"
+    write(toml_file, "port = 1\n")
+    backend = TOMLFile(toml_file)
+
+    watcher = Watcher(debounce=0)
+    watcher.watch(backend)
+
+    write(toml_file, "port = \n")
+    assert watcher.check() == {}
+    assert backend.get("port") == 1
+
+    toml_file.unlink()
+    assert watcher.check() == {}
+    assert backend.get("port") == 1
+
+
+def test_watcher_background_thread(tmp_path):
+    ini_file = tmp_path / "settings.ini"
+    write(ini_file, "[app]\nname = a\n")
+    ini = gconfigs.ini_file(ini_file)
+
+    with Watcher(interval=0.01, debounce=0) as watcher:
+        watcher.watch(ini)
+        write(ini_file, "[app]\nname = b\n")
+        for _ in range(200):
+            if ini("app.name") == "b":
+                break
+            time.sleep(0.01)
+
+    assert ini("app.name") == "b"
+
+
+def test_watcher_rejects_backends_without_files():
+    with pytest.raises(AttributeError):
+        Watcher().watch(LocalEnv())
+
+
+def test_watcher_failing_callback_does_not_skip_the_others(tmp_path, caplog):
+    dotenv_file = tmp_path / ".env"
+    write(dotenv_file, "A=1\n")
+    dotenvs = gconfigs.dotenvs(dotenv_file)
+
+    def fail(backend, keys):
+        raise RuntimeError("broken subscriber")
+
+    changes = []
+    watcher = Watcher(debounce=0)
+    watcher.watch(dotenvs, fail)
+    watcher.watch(dotenvs, lambda backend, keys: changes.append(keys))
+
+    write(dotenv_file, "A=2\n")
+    assert watcher.check() == {dotenvs.backend: {"A"}}
+    assert changes == [{"A"}]
+    assert "broken subscriber" in caplog.text
+
+
+def test_watcher_invalidates_composite_index(tmp_path, monkeypatch):
+    dotenv_file = tmp_path / ".env"
+    write(dotenv_file, "A=dotenv\n")
+    toml_file = tmp_path / "settings.toml"
+    write(toml_file, 'A = "toml"\nB = "toml"\n')
+    monkeypatch.delenv("A", raising=False)
+    monkeypatch.delenv("B", raising=False)
+
+    configs = gconfigs.composite([LocalEnv, DotEnv(dotenv_file), TOMLFile(toml_file)])
+    assert configs("B") == "toml"
+
+    changes = []
+    watcher = Watcher(debounce=0)
+    watcher.watch(configs, lambda backend, keys: changes.append(configs("B")))
+
+    write(dotenv_file, "A=dotenv\nB=dotenv\n")
+    assert watcher.check() == {configs.backend.backends[1]: {"B"}}
+    assert changes == ["dotenv"], "The index must be invalidated before callbacks."
+
+    watcher.unwatch(configs)
+    write(dotenv_file, "A=dotenv\n")
+    assert watcher.check() == {}
+
+    with pytest.raises(AttributeError):
+        watcher.watch(gconfigs.composite([LocalEnv]))
+
+
+def test_watcher_does_not_parse_lazy_backends(tmp_path, monkeypatch):
+    toml_file = tmp_path / "settings.toml"
+    write(toml_file, 'name = "app"\n\n[tenants.a]\nport = 1\n\n[tenants.b]\nport = 2\n')
+    dotenv_file = tmp_path / ".env"
+    write(dotenv_file, 'A="one"\nB=two\n')
+    toml = TOMLFile(toml_file, lazy=True)
+    dotenv = DotEnv(dotenv_file, lazy=True)
+
+    decoded = []
+    decode = backends._decode_dotenv_value
+    monkeypatch.setattr(
+        backends, "_decode_dotenv_value", lambda raw: decoded.append(raw) or decode(raw)
+    )
+
+    watcher = Watcher(debounce=0)
+    watcher.watch(toml)
+    watcher.watch(dotenv)
+    assert toml._data["tenants"].__class__.__name__ == "_LazyTable"
+
+    write(toml_file, 'name = "app"\n\n[tenants.a]\nport = 1\n\n[tenants.b]\nport = 3\n')
+    write(dotenv_file, 'A="one"\nB=changed\n')
+    assert watcher.check() == {toml: {"tenants.b"}, dotenv: {"B"}}
+    assert toml._data["tenants"].__class__.__name__ == "_LazyTable"
+    assert decoded == []
+
+    assert toml.get("tenants.b.port") == 3
+    assert dotenv.get("B") == "changed"
+
+    write(
+        toml_file, 'name = "other"\n\n[tenants.a]\nport = 1\n\n[tenants.b]\nport = 3\n'
+    )
+    assert watcher.check() == {toml: {"name"}}